@@ -28,9 +28,15 @@
         "data/sequence_data.xml",
         "data/automation_cron.xml",
         "data/mail_template.xml",
+        "data/qc_stat_data.xml",
         "views/qc_inspection_views.xml",
+        "views/qc_checklist_template_views.xml",
+        "views/qc_sampling_plan_views.xml",
+        "views/qc_spc_views.xml",
+        "views/qc_inspection_archive_views.xml",
         "views/qc_dashboard_template.xml",
         "views/stock_views.xml",
+        "views/res_company_views.xml",
         "views/dashboard_views.xml",
         "report/qc_report_templates.xml",
         "report/qc_report_actions.xml",
@@ -1 +1 @@
-from . import dashboard
+from . import dashboard, export, scanner
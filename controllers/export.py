@@ -0,0 +1,205 @@
+import csv
+import io
+import tempfile
+from datetime import datetime, time
+
+import xlsxwriter
+
+from odoo import api, fields, http
+from odoo.http import content_disposition, request
+
+from ..tools import metrics
+
+EXPORT_CHUNK_SIZE = 1000
+
+# Rows per worksheet, header included (Excel's limit).
+XLSX_MAX_ROWS = 1048576
+
+INSPECTION_FIELDS = [
+    "name",
+    "inspection_date",
+    "state",
+    "product_id",
+    "lot_id",
+    "partner_id",
+    "inspector_id",
+    "picking_id",
+    "quantity_to_inspect",
+    "quantity_accepted",
+    "quantity_rejected",
+    "pass_rate",
+]
+
+LINE_FIELDS = ["inspection_id", "sequence", "name", "result", "remarks"]
+
+HEADER = [
+    "Reference",
+    "Inspection Date",
+    "Status",
+    "Product",
+    "Lot/Serial Number",
+    "Supplier",
+    "Inspector",
+    "Source Transfer",
+    "Quantity to Inspect",
+    "Quantity Accepted",
+    "Quantity Rejected",
+    "Pass Rate %",
+    "Checkpoint Sequence",
+    "Checkpoint",
+    "Result",
+    "Remarks",
+]
+
+
+def _iter_export_rows(registry, uid, context, domain):
+    """Yield one row per checklist line (or per inspection without lines).
+
+    Runs on its own cursor because the response is streamed after the
+    request's cursor is closed. Inspections are read in id-ordered chunks and
+    the cache is dropped after each one, so memory does not grow with the
+    size of the range.
+    """
+    with registry.cursor() as cr:
+        env = api.Environment(cr, uid, context)
+        Inspection = env["qc.inspection"]
+        Line = env["qc.inspection.line"]
+        last_id = 0
+        while True:
+            inspections = Inspection.search(
+                domain + [("id", ">", last_id)], order="id", limit=EXPORT_CHUNK_SIZE
+            )
+            if not inspections:
+                break
+
+            lines_by_inspection = {}
+            for line in Line.search_read(
+                [("inspection_id", "in", inspections.ids)],
+                LINE_FIELDS,
+                order="inspection_id, sequence, id",
+            ):
+                lines_by_inspection.setdefault(line["inspection_id"][0], []).append(
+                    line
+                )
+
+            for inspection in inspections.read(INSPECTION_FIELDS):
+                row = [
+                    inspection["name"],
+                    fields.Datetime.to_string(inspection["inspection_date"]),
+                    inspection["state"],
+                    *(
+                        inspection[fname] and inspection[fname][1]
+                        for fname in (
+                            "product_id",
+                            "lot_id",
+                            "partner_id",
+                            "inspector_id",
+                            "picking_id",
+                        )
+                    ),
+                    inspection["quantity_to_inspect"],
+                    inspection["quantity_accepted"],
+                    inspection["quantity_rejected"],
+                    round(inspection["pass_rate"], 2),
+                ]
+                lines = lines_by_inspection.get(inspection["id"])
+                if not lines:
+                    yield row + ["", "", "", ""]
+                for line in lines or []:
+                    yield row + [
+                        line["sequence"],
+                        line["name"],
+                        line["result"] or "",
+                        line["remarks"] or "",
+                    ]
+
+            last_id = inspections[-1].id
+            env.invalidate_all()
+
+
+def _stream_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([value if value is not False else "" for value in row])
+        if count % EXPORT_CHUNK_SIZE == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _stream_xlsx(rows):
+    # xlsx is a zip archive, so it has to be complete before it is sent;
+    # constant_memory mode flushes every row to disk as it is written.
+    with tempfile.TemporaryFile() as f:
+        workbook = xlsxwriter.Workbook(f, {"constant_memory": True})
+        worksheet = None
+        index = XLSX_MAX_ROWS
+        for row in rows:
+            # A sheet holds XLSX_MAX_ROWS rows: carry on in a new one rather
+            # than letting xlsxwriter drop the rest.
+            if index == XLSX_MAX_ROWS:
+                number = len(workbook.worksheets()) + 1
+                worksheet = workbook.add_worksheet(
+                    "Inspections" if number == 1 else f"Inspections {number}"
+                )
+                worksheet.write_row(0, 0, HEADER)
+                index = 1
+            worksheet.write_row(
+                index, 0, [value if value is not False else "" for value in row]
+            )
+            index += 1
+        if worksheet is None:
+            workbook.add_worksheet("Inspections").write_row(0, 0, HEADER)
+        workbook.close()
+
+        f.seek(0)
+        while chunk := f.read(64 * 1024):
+            yield chunk
+
+
+class QCExportController(http.Controller):
+
+    @http.route("/qc/export/inspections", type="http", auth="user")
+    @metrics.instrumented("qc_export_inspections")
+    def qc_export_inspections(self, date_from, date_to, file_format="csv", **kwargs):
+        """Stream inspections and their checklist results for a date range"""
+        domain = [
+            (
+                "inspection_date",
+                ">=",
+                datetime.combine(fields.Date.to_date(date_from), time.min),
+            ),
+            (
+                "inspection_date",
+                "<=",
+                datetime.combine(fields.Date.to_date(date_to), time.max),
+            ),
+        ]
+        rows = _iter_export_rows(
+            request.env.registry,
+            request.env.uid,
+            dict(request.env.context),
+            domain,
+        )
+
+        if file_format == "xlsx":
+            body = _stream_xlsx(rows)
+            filename = f"qc_inspections_{date_from}_{date_to}.xlsx"
+            mimetype = (
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+        else:
+            body = _stream_csv(rows)
+            filename = f"qc_inspections_{date_from}_{date_to}.csv"
+            mimetype = "text/csv; charset=utf-8"
+
+        return request.make_response(
+            body,
+            headers=[
+                ("Content-Type", mimetype),
+                ("Content-Disposition", content_disposition(filename)),
+            ],
+        )
@@ -0,0 +1,24 @@
+from odoo import http
+from odoo.http import request
+
+from ..tools import metrics
+
+
+class QCScannerController(http.Controller):
+
+    @http.route("/qc/scanner/submit", type="json", auth="user")
+    @metrics.instrumented("qc_scanner_submit")
+    def qc_scanner_submit(self, submissions=None, **kwargs):
+        """Apply a batch of inspection results recorded on a scanner.
+
+        ``submissions`` is a list of items, each with a client-generated
+        ``uuid`` so that batches queued offline can be replayed safely. See
+        ``qc.scanner.submission._process_batch`` for the item format.
+        """
+        if not isinstance(submissions, list):
+            return {"error": "submissions must be a list"}
+        return {
+            "results": request.env["qc.scanner.submission"]._process_batch(
+                submissions
+            )
+        }
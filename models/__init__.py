@@ -1 +1,16 @@
-from . import qc_inspection, stock_extension
+from . import (
+    ir_actions_report,
+    qc_product_rule,
+    qc_checklist_template,
+    qc_dashboard_version,
+    qc_inspection,
+    qc_inspection_archive,
+    qc_inspection_stat,
+    qc_notification,
+    qc_sampling_plan,
+    qc_scanner_submission,
+    qc_spc,
+    qc_status_queue,
+    res_company,
+    stock_extension,
+)
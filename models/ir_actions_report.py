@@ -0,0 +1,96 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo import api, models
+from odoo.tools import SQL
+
+from ..tools.metrics import instrumented
+
+QC_REPORT = "smart_inventory_qc.report_qc_inspection"
+
+
+class IrActionsReport(models.Model):
+    _inherit = "ir.actions.report"
+
+    def _render_qweb_pdf(self, report_ref, res_ids=None, data=None):
+        if self._get_report(report_ref).report_name != QC_REPORT:
+            return super()._render_qweb_pdf(report_ref, res_ids=res_ids, data=data)
+        return self._render_qc_report_pdf(report_ref, res_ids=res_ids, data=data)
+
+    @instrumented("report_qc_inspection")
+    def _render_qc_report_pdf(self, report_ref, res_ids=None, data=None):
+        return super()._render_qweb_pdf(report_ref, res_ids=res_ids, data=data)
+
+    def _render_qweb_pdf_prepare_streams(self, report_ref, data, res_ids=None):
+        ICP = self.env["ir.config_parameter"].sudo()
+        batch_size = int(ICP.get_param("smart_inventory_qc.report_batch_size", 50))
+        if (
+            self._get_report(report_ref).report_name != QC_REPORT
+            or not res_ids
+            or len(res_ids) <= batch_size
+            or len(set(res_ids)) != len(res_ids)
+        ):
+            return super()._render_qweb_pdf_prepare_streams(
+                report_ref, data, res_ids=res_ids
+            )
+
+        # Large selections are split into chunks rendered by separate
+        # wkhtmltopdf runs; _render_qweb_pdf merges the resulting streams.
+        # Completed inspections already rendered at their current write_date
+        # come from the report attachments without rendering at all.
+        chunks = [
+            res_ids[i : i + batch_size] for i in range(0, len(res_ids), batch_size)
+        ]
+        workers = min(
+            int(ICP.get_param("smart_inventory_qc.report_workers", 4)), len(chunks)
+        )
+        if (
+            workers <= 1
+            or getattr(threading.current_thread(), "testing", False)
+            or self._has_uncommitted_changes()
+        ):
+            results = [
+                super(IrActionsReport, self)._render_qweb_pdf_prepare_streams(
+                    report_ref, dict(data or {}), res_ids=chunk
+                )
+                for chunk in chunks
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda chunk: self._render_qc_report_chunk(
+                            report_ref, data, chunk
+                        ),
+                        chunks,
+                    )
+                )
+
+        streams = {}
+        for result in results:
+            for res_id, stream_data in result.items():
+                if stream_data["attachment"]:
+                    stream_data["attachment"] = stream_data["attachment"].with_env(
+                        self.env
+                    )
+                streams[res_id] = stream_data
+        return streams
+
+    def _has_uncommitted_changes(self):
+        """Whether this transaction wrote anything, pending ORM writes
+        included. Worker threads render on their own cursors, which would not
+        see those changes."""
+        self.env.flush_all()
+        self.env.cr.execute(SQL("SELECT txid_current_if_assigned() IS NOT NULL"))
+        return self.env.cr.fetchone()[0]
+
+    def _render_qc_report_chunk(self, report_ref, data, res_ids):
+        # Worker threads can't share the request cursor.
+        threading.current_thread().dbname = self.env.cr.dbname
+        with self.env.registry.cursor() as cr:
+            env = api.Environment(cr, self.env.uid, self.env.context, su=self.env.su)
+            return super(
+                IrActionsReport, self.with_env(env)
+            )._render_qweb_pdf_prepare_streams(
+                report_ref, dict(data or {}), res_ids=res_ids
+            )
@@ -0,0 +1,29 @@
+from odoo import fields, models
+
+
+class QCChecklistTemplate(models.Model):
+    _name = "qc.checklist.template"
+    _inherit = ["qc.product.rule.mixin"]
+    _description = "QC Checklist Template"
+
+    name = fields.Char(string="Template Name", required=True)
+
+    line_ids = fields.One2many(
+        "qc.checklist.template.line", "template_id", string="Checkpoints", copy=True
+    )
+
+
+class QCChecklistTemplateLine(models.Model):
+    _name = "qc.checklist.template.line"
+    _description = "QC Checklist Template Checkpoint"
+    _order = "sequence, id"
+
+    template_id = fields.Many2one(
+        "qc.checklist.template", string="Template", required=True, ondelete="cascade"
+    )
+
+    sequence = fields.Integer(default=10)
+
+    name = fields.Char(string="Checkpoint", required=True)
+
+    description = fields.Text(string="Description")
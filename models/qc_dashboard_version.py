@@ -0,0 +1,51 @@
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+# Each transaction bumps one slot, picked by its transaction id, so that
+# concurrent inspection changes rarely wait on the same row.
+VERSION_SLOTS = 16
+
+
+class QCDashboardVersion(models.Model):
+    _name = "qc.dashboard.version"
+    _description = "QC Dashboard Version"
+    _log_access = False
+
+    slot = fields.Integer(string="Slot", required=True, readonly=True)
+
+    version = fields.Integer(string="Version", readonly=True)
+
+    _sql_constraints = [
+        ("slot_uniq", "UNIQUE(slot)", "A dashboard version slot must be unique!"),
+    ]
+
+    @api.model
+    def _get_version(self):
+        """Number of committed transactions that changed inspections, as seen
+        by this transaction."""
+        self.env.cr.execute(
+            SQL("SELECT COALESCE(SUM(version), 0) FROM qc_dashboard_version")
+        )
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def _bump(self):
+        """Bump the version once, when the current transaction commits."""
+        cr = self.env.cr
+        if cr.precommit.data.get("qc_dashboard_version_bumped"):
+            return
+        cr.precommit.data["qc_dashboard_version_bumped"] = True
+
+        @cr.precommit.add
+        def bump():
+            cr.execute(
+                SQL(
+                    """
+                    INSERT INTO qc_dashboard_version (slot, version)
+                    VALUES (MOD(txid_current(), %s), 1)
+                    ON CONFLICT (slot)
+                    DO UPDATE SET version = qc_dashboard_version.version + 1
+                    """,
+                    VERSION_SLOTS,
+                )
+            )
@@ -1,5 +1,42 @@
-from odoo import api, fields, models
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from psycopg2.errors import UniqueViolation
+
+from odoo import api, fields, models, tools
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import SQL
+
+from ..tools.metrics import instrumented
+from .qc_sampling_plan import LOT_INSPECTION_MODES, SEVERITY_SELECTION
+
+_logger = logging.getLogger(__name__)
+
+# Context for companies in high-volume mode: no per-field tracking, creation
+# log or follower subscription on qc.inspection.
+HIGH_VOLUME_CONTEXT = {
+    "tracking_disable": True,
+    "mail_create_nolog": True,
+    "mail_create_nosubscribe": True,
+    "mail_notrack": True,
+}
+
+# Failures committed by transactions that started before the previous poll
+# still show up in the next one.
+DASHBOARD_FAILURE_OVERLAP = timedelta(minutes=5)
+
+STAT_FIELDS = {
+    "state",
+    "inspection_date",
+    "picking_id",
+    "product_id",
+    "company_id",
+    "quantity_to_inspect",
+    "quantity_accepted",
+    "quantity_rejected",
+}
 
 
 class QCInspection(models.Model):
@@ -30,6 +67,7 @@ class QCInspection(models.Model):
         string="Inspection Date",
         default=fields.Datetime.now,
         required=True,
+        index=True,
         tracking=True,
     )
 
@@ -76,6 +114,50 @@ class QCInspection(models.Model):
         string="Quantity Rejected", digits="Product Unit of Measure", default=0.0
     )
 
+    sampling_plan_id = fields.Many2one("qc.sampling.plan", string="Sampling Plan")
+
+    lot_size = fields.Float(string="Lot Size", digits="Product Unit of Measure")
+
+    sample_code_letter = fields.Char(string="Code Letter", readonly=True)
+
+    lot_inspection_mode = fields.Selection(
+        LOT_INSPECTION_MODES, string="Lots/Serials", default="first", readonly=True
+    )
+
+    lot_result_ids = fields.One2many(
+        "qc.inspection.lot", "inspection_id", string="Lot/Serial Results"
+    )
+
+    lot_result_count = fields.Integer(
+        string="Lots/Serials", compute="_compute_lot_result_counts"
+    )
+
+    lot_failed_count = fields.Integer(
+        string="Failed Lots/Serials", compute="_compute_lot_result_counts"
+    )
+
+    lot_pending_count = fields.Integer(
+        string="Pending Lots/Serials", compute="_compute_lot_result_counts"
+    )
+
+    inspection_severity = fields.Selection(
+        SEVERITY_SELECTION, string="Inspection Severity", readonly=True
+    )
+
+    acceptance_number = fields.Integer(
+        string="Acceptance Number",
+        readonly=True,
+        help="The lot is accepted while the rejected units of the sample do not "
+        "exceed this number.",
+    )
+
+    rejection_number = fields.Integer(
+        string="Rejection Number",
+        readonly=True,
+        help="The lot is rejected once the rejected units of the sample reach "
+        "this number.",
+    )
+
     pass_rate = fields.Float(
         string="Pass Rate %", compute="_compute_pass_rate", store=True, tracking=True
     )
@@ -95,8 +177,29 @@ class QCInspection(models.Model):
         "qc.inspection.line", "inspection_id", string="Inspection Checklist"
     )
 
+    checklist_total = fields.Integer(
+        string="Checkpoints", compute="_compute_checklist_progress", store=True
+    )
+
+    checklist_done = fields.Integer(
+        string="Completed Checkpoints",
+        compute="_compute_checklist_progress",
+        store=True,
+    )
+
+    checklist_failed = fields.Integer(
+        string="Failed Checkpoints", compute="_compute_checklist_progress", store=True
+    )
+
     checklist_progress = fields.Float(
-        string="Checklist Progress", compute="_compute_checklist_progress"
+        string="Checklist Progress",
+        compute="_compute_checklist_progress",
+        store=True,
+        aggregator="avg",
+    )
+
+    checklist_template_id = fields.Many2one(
+        "qc.checklist.template", string="Checklist Template", readonly=True
     )
 
     company_id = fields.Many2one(
@@ -111,13 +214,132 @@ class QCInspection(models.Model):
         ),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get("name", "New") == "New":
-            vals["name"] = (
-                self.env["ir.sequence"].next_by_code("qc.inspection") or "New"
+    def init(self):
+        self.env.cr.execute(
+            SQL(
+                """
+                CREATE UNIQUE INDEX IF NOT EXISTS qc_inspection_active_picking_product_uniq
+                    ON qc_inspection (picking_id, product_id)
+                 WHERE state != 'cancel' AND picking_id IS NOT NULL
+                """
+            )
+        )
+        # Dashboard failures changed since the previous poll.
+        tools.create_index(
+            self.env.cr, "qc_inspection_write_date_index", self._table, ["write_date"]
+        )
+        # Recent failures, and the Failed filter in the default order.
+        tools.create_index(
+            self.env.cr,
+            "qc_inspection_fail_date_index",
+            self._table,
+            ["inspection_date DESC", "id DESC"],
+            where="state = 'fail'",
+        )
+        # Draft and In Progress filters: a small, moving subset of the table.
+        tools.create_index(
+            self.env.cr,
+            "qc_inspection_open_state_index",
+            self._table,
+            ["state", "inspection_date DESC"],
+            where="state IN ('draft', 'in_progress')",
+        )
+        # Uniqueness check, creation paths and the transfer's inspections.
+        # Unlike the unique index above, it also covers cancelled rows.
+        tools.create_index(
+            self.env.cr,
+            "qc_inspection_picking_product_state_index",
+            self._table,
+            ["picking_id", "product_id", "state"],
+        )
+        # Daily statistics buckets, refreshed on every create/write/unlink.
+        tools.create_index(
+            self.env.cr,
+            "qc_inspection_product_date_index",
+            self._table,
+            ["product_id", "inspection_date"],
+        )
+        # Supplier analysis over a date range.
+        tools.create_index(
+            self.env.cr,
+            "qc_inspection_partner_date_index",
+            self._table,
+            ["partner_id", "inspection_date"],
+        )
+
+    @api.model_create_multi
+    @instrumented("qc_inspection_create")
+    def create(self, vals_list):
+        for vals in vals_list:
+            if vals.get("name", "New") == "New":
+                vals["name"] = (
+                    self.env["ir.sequence"].next_by_code("qc.inspection") or "New"
+                )
+        self._check_active_duplicates(
+            [
+                (vals.get("picking_id"), vals.get("product_id"), vals.get("state"))
+                for vals in vals_list
+            ]
+        )
+        records = super().create(vals_list)
+        self.env["qc.inspection.stat.daily"]._refresh_buckets(
+            records._get_stat_keys()
+        )
+        self.env["qc.dashboard.version"]._bump()
+        return records
+
+    def write(self, vals):
+        if {"picking_id", "product_id", "state"}.intersection(vals):
+            self._check_active_duplicates(
+                [
+                    (
+                        vals.get("picking_id", record.picking_id.id),
+                        vals.get("product_id", record.product_id.id),
+                        vals.get("state", record.state),
+                    )
+                    for record in self
+                ],
+                exclude_ids=self.ids,
+            )
+        if not STAT_FIELDS.intersection(vals):
+            return super().write(vals)
+        keys = self._get_stat_keys()
+        res = super().write(vals)
+        self.env["qc.inspection.stat.daily"]._refresh_buckets(
+            keys | self._get_stat_keys()
+        )
+        self.env["qc.dashboard.version"]._bump()
+        if "state" in vals:
+            # Leave the transfer row alone: its QC status is recomputed by a
+            # background job, once per transfer for all changes queued.
+            self.env["qc.status.queue"]._enqueue(self.picking_id.ids)
+        return res
+
+    def unlink(self):
+        keys = self._get_stat_keys()
+        res = super().unlink()
+        self.env["qc.inspection.stat.daily"]._refresh_buckets(keys)
+        self.env["qc.dashboard.version"]._bump()
+        return res
+
+    def _get_stat_keys(self):
+        return {
+            (
+                record.inspection_date.date(),
+                record.partner_id.id or None,
+                record.product_id.id,
+                record.company_id.id or None,
             )
-        return super().create(vals)
+            for record in self
+        }
+
+    @api.model
+    def load(self, fields, data):
+        # Imports are bulk by nature: follow the company's high-volume mode.
+        records = self
+        if self.env.company.qc_high_volume_mode:
+            records = self.with_context(**HIGH_VOLUME_CONTEXT)
+        return super(QCInspection, records).load(fields, data)
 
     @api.depends("quantity_to_inspect", "quantity_accepted", "quantity_rejected")
     def _compute_pass_rate(self):
@@ -143,17 +365,62 @@ class QCInspection(models.Model):
 
     @api.depends("checklist_ids", "checklist_ids.result")
     def _compute_checklist_progress(self):
+        # One grouped query for the saved inspections; inspections being
+        # edited in a form count their unsaved lines from the cache.
+        counts = defaultdict(dict)
+        for inspection, result, count in self.env["qc.inspection.line"]._read_group(
+            [("inspection_id", "in", self.filtered("id").ids)],
+            ["inspection_id", "result"],
+            ["__count"],
+        ):
+            counts[inspection.id][result] = count
+
         for record in self:
-            total = len(record.checklist_ids)
-            if total > 0:
-                completed = len(
-                    record.checklist_ids.filtered(
-                        lambda x: x.result in ["pass", "fail"]
-                    )
-                )
-                record.checklist_progress = (completed / total) * 100
+            if record.id:
+                result_counts = counts[record.id]
             else:
-                record.checklist_progress = 0.0
+                result_counts = defaultdict(int)
+                for line in record.checklist_ids:
+                    result_counts[line.result] += 1
+            total = sum(result_counts.values())
+            done = result_counts.get("pass", 0) + result_counts.get("fail", 0)
+            record.checklist_total = total
+            record.checklist_done = done
+            record.checklist_failed = result_counts.get("fail", 0)
+            record.checklist_progress = (done / total) * 100 if total else 0.0
+
+    @api.depends("lot_result_ids.result")
+    def _compute_lot_result_counts(self):
+        counts = defaultdict(dict)
+        for inspection, result, count in self.env["qc.inspection.lot"]._read_group(
+            [("inspection_id", "in", self._origin.ids)],
+            ["inspection_id", "result"],
+            ["__count"],
+        ):
+            counts[inspection.id][result] = count
+
+        for record in self:
+            result_counts = counts[record._origin.id]
+            record.lot_result_count = sum(result_counts.values())
+            record.lot_failed_count = result_counts.get("fail", 0)
+            record.lot_pending_count = result_counts.get(False, 0)
+
+    @api.onchange("product_id")
+    def _onchange_product_id_sampling_plan(self):
+        if self.product_id and not self.sampling_plan_id:
+            plans = self.env["qc.sampling.plan"]._get_for_products(self.product_id)
+            self.sampling_plan_id = plans.get(self.product_id.id)
+
+    @api.onchange("sampling_plan_id", "lot_size")
+    def _onchange_sampling_plan(self):
+        if self.sampling_plan_id and self.lot_size > 0:
+            key = (self.partner_id.id, self.product_id.id, self.company_id.id or None)
+            severity = self.env["qc.supplier.quality"]._get_severities([key])
+            self.update(
+                self.sampling_plan_id._get_sampling_values(
+                    self.lot_size, severity.get(key, "normal")
+                )
+            )
 
     @api.constrains("quantity_accepted", "quantity_rejected", "quantity_to_inspect")
     def _check_quantities(self):
@@ -166,66 +433,242 @@ class QCInspection(models.Model):
             if record.quantity_accepted < 0 or record.quantity_rejected < 0:
                 raise ValidationError("Quantities cannot be negative!")
 
-    @api.constrains("picking_id", "product_id")
-    def _check_unique_inspection(self):
-        for record in self:
-            if record.picking_id and record.product_id:
-                existing = self.search(
-                    [
-                        ("picking_id", "=", record.picking_id.id),
-                        ("product_id", "=", record.product_id.id),
-                        ("id", "!=", record.id),
-                        ("state", "!=", "cancel"),
-                    ]
-                )
-                if existing:
-                    raise ValidationError(
-                        f"Active QC inspection already exists for {record.product_id.name} "
-                        f"in transfer {record.picking_id.name}"
-                    )
+    @api.model
+    def _get_active_duplicates(self, keys, exclude_ids=()):
+        """Return the (picking_id, product_id) pairs among ``keys`` that
+        would get a second active inspection: repeated within ``keys`` or
+        already inspected outside ``exclude_ids``. ``keys`` are (picking_id,
+        product_id, state) triples."""
+        pairs = defaultdict(int)
+        for picking_id, product_id, state in keys:
+            if picking_id and product_id and state != "cancel":
+                pairs[picking_id, product_id] += 1
+        if not pairs:
+            return set()
+        duplicates = {pair for pair, count in pairs.items() if count > 1}
+        domain = [
+            ("picking_id", "in", list({pair[0] for pair in pairs})),
+            ("product_id", "in", list({pair[1] for pair in pairs})),
+            ("state", "!=", "cancel"),
+        ]
+        if exclude_ids:
+            domain.append(("id", "not in", list(exclude_ids)))
+        # The unique index sees every inspection, not only the user's own;
+        # only the keys come back.
+        for picking, product in self.sudo()._read_group(
+            domain, ["picking_id", "product_id"]
+        ):
+            if (picking.id, product.id) in pairs:
+                duplicates.add((picking.id, product.id))
+        return duplicates
 
+    @api.model
+    def _check_active_duplicates(self, keys, exclude_ids=()):
+        # The partial unique index enforces this, but it fails the INSERT or
+        # UPDATE with a raw database error: check first for a readable one.
+        duplicates = self._get_active_duplicates(keys, exclude_ids)
+        if duplicates:
+            picking_id, product_id = min(duplicates)
+            raise ValidationError(
+                f"Active QC inspection already exists for "
+                f"{self.env['product.product'].browse(product_id).sudo().name} "
+                f"in transfer "
+                f"{self.env['stock.picking'].browse(picking_id).sudo().name}"
+            )
+
+    @instrumented("action_start_inspection")
     def action_start_inspection(self):
-        self.ensure_one()
-        if self.state != "draft":
-            raise UserError("Only draft inspections can be started!")
-        self.state = "in_progress"
-        self.message_post(body="Inspection started")
+        self._check_state(["draft"], "Only draft inspections can be started!")
+        for records in self._split_high_volume():
+            records.write({"state": "in_progress"})
+        # Serials are usually only entered on the receipt after confirmation.
+        self._instantiate_lot_results()
+        self._log_batch(
+            {record.id: "Inspection started" for record in self},
+            "QC inspections started",
+        )
 
+    @instrumented("action_pass")
     def action_pass(self):
-        self.ensure_one()
-        if self.state != "in_progress":
-            raise UserError("Only in-progress inspections can be passed!")
-
-        if self.quantity_accepted == 0:
-            self.quantity_accepted = self.quantity_to_inspect
-
-        self.state = "pass"
-        self.message_post(
-            body=f"✅ Inspection PASSED - {self.pass_rate:.1f}% pass rate"
+        self._check_state(
+            ["in_progress"], "Only in-progress inspections can be passed!"
         )
+        self._check_sampling_result("pass")
+        for records in self._split_high_volume():
+            records._write_result("pass", "quantity_accepted")
+        self._log_batch(
+            {
+                record.id: f"✅ Inspection PASSED - {record.pass_rate:.1f}% pass rate"
+                for record in self
+            },
+            "✅ QC inspections PASSED",
+        )
+        self.env["qc.supplier.quality"].sudo()._record_results(self)
         self._send_notification_email()
 
+    @instrumented("action_fail")
     def action_fail(self):
-        self.ensure_one()
-        if self.state != "in_progress":
-            raise UserError("Only in-progress inspections can be failed!")
-
-        if self.quantity_rejected == 0:
-            self.quantity_rejected = self.quantity_to_inspect
-
-        self.state = "fail"
-        self.message_post(
-            body=f"❌ Inspection FAILED - {self.pass_rate:.1f}% pass rate"
+        self._check_state(
+            ["in_progress"], "Only in-progress inspections can be failed!"
         )
+        self._check_sampling_result("fail")
+        for records in self._split_high_volume():
+            records._write_result("fail", "quantity_rejected")
+        self._log_batch(
+            {
+                record.id: f"❌ Inspection FAILED - {record.pass_rate:.1f}% pass rate"
+                for record in self
+            },
+            "❌ QC inspections FAILED",
+        )
+        self.env["qc.supplier.quality"].sudo()._record_results(self)
         self._send_notification_email()
         self._create_quality_alert()
 
+    @instrumented("action_cancel")
     def action_cancel(self):
-        self.ensure_one()
-        if self.state in ["pass", "fail"]:
+        if any(record.state in ["pass", "fail"] for record in self):
             raise UserError("Cannot cancel completed inspections!")
-        self.state = "cancel"
-        self.message_post(body="Inspection cancelled")
+        for records in self._split_high_volume():
+            records.write({"state": "cancel"})
+        self._log_batch(
+            {record.id: "Inspection cancelled" for record in self},
+            "QC inspections cancelled",
+        )
+
+    def _split_high_volume(self):
+        """Yield these inspections grouped by their company's mode, the
+        high-volume group with per-field tracking disabled."""
+        high_volume = self.filtered("company_id.qc_high_volume_mode")
+        if high_volume:
+            yield high_volume.with_context(**HIGH_VOLUME_CONTEXT)
+        if self - high_volume:
+            yield self - high_volume
+
+    def _log_batch(self, bodies, summary):
+        """Log one chatter message per inspection from ``bodies``. In
+        high-volume mode, inspections of a transfer get a single ``summary``
+        message on the transfer instead."""
+        summarized = self.filtered(
+            lambda r: r.company_id.qc_high_volume_mode and r.picking_id
+        )
+        names_by_picking = defaultdict(list)
+        for record in summarized:
+            names_by_picking[record.picking_id.id].append(record.name)
+        if names_by_picking:
+            self.env["stock.picking"].browse(names_by_picking)._message_log_batch(
+                {
+                    picking_id: f"{summary}: {', '.join(names)}"
+                    for picking_id, names in names_by_picking.items()
+                }
+            )
+
+        others = self - summarized
+        if others and bodies:
+            others._message_log_batch(
+                {record.id: bodies[record.id] for record in others}
+            )
+
+    def _check_state(self, states, message):
+        invalid = self.filtered(lambda r: r.state not in states)
+        if invalid:
+            if len(self) > 1:
+                message += "\n" + ", ".join(invalid.mapped("name"))
+            raise UserError(message)
+
+    def _check_sampling_result(self, state):
+        """Under a sampling plan the verdict follows the rejected units of the
+        sample: pass up to the acceptance number, fail from the rejection
+        number on. A failed checkpoint still allows failing the lot. A failed
+        lot/serial always fails the inspection."""
+        if state == "pass":
+            failed_lots = self.filtered("lot_failed_count")
+            if failed_lots:
+                message = "Some lots/serials failed, the inspection must be failed!"
+                if len(self) > 1:
+                    message += "\n" + ", ".join(failed_lots.mapped("name"))
+                raise UserError(message)
+
+        sampled = self.filtered("sampling_plan_id")
+        if state == "pass":
+            invalid = sampled.filtered(
+                lambda r: r.quantity_rejected >= r.rejection_number
+            )
+            message = (
+                "The rejected quantity reaches the rejection number of the "
+                "sampling plan, the lot must be failed!"
+            )
+        else:
+            invalid = sampled.filtered(
+                lambda r: 0 < r.quantity_rejected <= r.acceptance_number
+                and "fail" not in r.checklist_ids.mapped("result")
+                and not r.lot_failed_count
+            )
+            message = (
+                "The rejected quantity is within the acceptance number of the "
+                "sampling plan, the lot must be passed!"
+            )
+        if invalid:
+            if len(self) > 1:
+                message += "\n" + ", ".join(invalid.mapped("name"))
+            raise UserError(message)
+
+    def _write_result(self, state, quantity_field):
+        """Set ``state`` with a single write, first defaulting an empty
+        ``quantity_field`` to the full quantity to inspect with one UPDATE."""
+        to_fill = self.filtered(lambda r: r[quantity_field] == 0)
+        if to_fill:
+            to_fill.flush_recordset([quantity_field, "quantity_to_inspect"])
+            self.env.cr.execute(
+                SQL(
+                    """
+                    UPDATE qc_inspection
+                       SET %(field)s = quantity_to_inspect
+                     WHERE id = ANY(%(ids)s)
+                       AND %(field)s = 0
+                    """,
+                    field=SQL.identifier(quantity_field),
+                    ids=to_fill.ids,
+                )
+            )
+            to_fill.invalidate_recordset([quantity_field])
+            to_fill.modified([quantity_field])
+            to_fill._check_quantities()
+        # Statistics pick the new quantities up with the state change.
+        self.write({"state": state})
+
+    def action_load_lot_results(self):
+        self._instantiate_lot_results()
+
+    def action_pass_pending_lots(self):
+        self._check_state(
+            ["in_progress"], "Only in-progress inspections can record results!"
+        )
+        self.env["qc.inspection.lot"].flush_model(["result"])
+        self.env.cr.execute(
+            SQL(
+                """
+                UPDATE qc_inspection_lot
+                   SET result = 'pass'
+                 WHERE inspection_id = ANY(%s)
+                   AND result IS NULL
+                """,
+                self.ids,
+            )
+        )
+        self.env["qc.inspection.lot"].invalidate_model(["result"])
+        self.modified(["lot_result_ids"])
+
+    def action_view_lot_results(self):
+        self.ensure_one()
+        return {
+            "type": "ir.actions.act_window",
+            "name": f"Lots/Serials of {self.name}",
+            "res_model": "qc.inspection.lot",
+            "view_mode": "list",
+            "domain": [("inspection_id", "=", self.id)],
+            "context": {"default_inspection_id": self.id},
+        }
 
     def action_reset_to_draft(self):
         self.ensure_one()
@@ -235,74 +678,492 @@ class QCInspection(models.Model):
         self.message_post(body="Inspection reset to draft")
 
     def _send_notification_email(self):
-        template = self.env.ref(
-            "smart_inventory_qc.email_qc_result", raise_if_not_found=False
+        # Only queued here; the notification cron renders and sends them.
+        self.env["qc.notification"].sudo().create(
+            [
+                {"inspection_id": record.id, "partner_id": record.partner_id.id}
+                for record in self
+                if record.partner_id
+            ]
         )
-        if template and self.partner_id:
-            template.send_mail(self.id, force_send=True)
 
     def _create_quality_alert(self):
-        if self.picking_id and self.partner_id:
-            self.env["mail.activity"].create(
+        records = self.filtered(lambda r: r.picking_id and r.partner_id)
+        if not records:
+            return
+        res_model_id = self.env["ir.model"]._get("stock.picking").id
+        activity_type_id = self.env.ref("mail.mail_activity_data_warning").id
+        self.env["mail.activity"].create(
+            [
                 {
-                    "res_id": self.picking_id.id,
-                    "res_model_id": self.env["ir.model"]._get("stock.picking").id,
-                    "activity_type_id": self.env.ref(
-                        "mail.mail_activity_data_warning"
-                    ).id,
-                    "summary": f"QC Failed: {self.product_id.name}",
-                    "note": f"Quality inspection failed with {self.pass_rate:.1f}% pass rate.<br/>"
-                    f"Rejected quantity: {self.quantity_rejected}<br/>"
-                    f"Inspection: {self.name}",
-                    "user_id": self.picking_id.user_id.id or self.env.user.id,
+                    "res_id": record.picking_id.id,
+                    "res_model_id": res_model_id,
+                    "activity_type_id": activity_type_id,
+                    "summary": f"QC Failed: {record.product_id.name}",
+                    "note": f"Quality inspection failed with {record.pass_rate:.1f}% pass rate.<br/>"
+                    f"Rejected quantity: {record.quantity_rejected}<br/>"
+                    f"Inspection: {record.name}",
+                    "user_id": record.picking_id.user_id.id or self.env.user.id,
                 }
+                for record in records
+            ]
+        )
+
+    @api.model
+    def _get_dashboard_stats(self, today=None):
+        """Today/week/month counters computed in a single aggregate query."""
+        today = today or fields.Date.context_today(self)
+        today_start = datetime.combine(today, time.min)
+        today_end = datetime.combine(today, time.max)
+        week_start = datetime.combine(today - timedelta(days=7), time.min)
+        month_start = datetime.combine(today - timedelta(days=30), time.min)
+
+        # The month window contains the other two, so it bounds the scan.
+        query = self._search([("inspection_date", ">=", month_start)])
+        date_sql = self._field_to_sql(query.table, "inspection_date", query)
+        state_sql = self._field_to_sql(query.table, "state", query)
+        in_today = SQL("%s BETWEEN %s AND %s", date_sql, today_start, today_end)
+        in_week = SQL("%s >= %s", date_sql, week_start)
+        passed = SQL("%s = 'pass'", state_sql)
+
+        [row] = self.env.execute_query(
+            query.select(
+                SQL("COUNT(*) FILTER (WHERE %s)", in_today),
+                SQL(
+                    "COUNT(*) FILTER (WHERE %s AND %s IN ('draft', 'in_progress'))",
+                    in_today,
+                    state_sql,
+                ),
+                SQL("COUNT(*) FILTER (WHERE %s AND %s)", in_today, passed),
+                SQL("COUNT(*) FILTER (WHERE %s AND %s = 'fail')", in_today, state_sql),
+                SQL("COUNT(*) FILTER (WHERE %s)", in_week),
+                SQL("COUNT(*) FILTER (WHERE %s AND %s)", in_week, passed),
+                SQL("COUNT(*)"),
+                SQL("COUNT(*) FILTER (WHERE %s)", passed),
             )
+        )
+        (
+            today_total,
+            today_pending,
+            today_passed,
+            today_failed,
+            week_total,
+            week_passed,
+            month_total,
+            month_passed,
+        ) = row
+
+        return {
+            "today_total": today_total,
+            "today_pending": today_pending,
+            "today_passed": today_passed,
+            "today_failed": today_failed,
+            "week_total": week_total,
+            "week_passed": week_passed,
+            "week_pass_rate": (
+                round((week_passed / week_total * 100), 1) if week_total > 0 else 0
+            ),
+            "month_total": month_total,
+            "month_passed": month_passed,
+            "month_pass_rate": (
+                round((month_passed / month_total * 100), 1) if month_total > 0 else 0
+            ),
+        }
 
     @api.model
-    def cron_auto_create_incoming_qc(self):
+    def _get_dashboard_data(self):
+        """Dashboard counters and recent failures, cached per company,
+        timezone-day and visibility scope.
+
+        The cache key includes the dashboard version, which every committed
+        transaction creating, changing or deleting inspections bumps, so the
+        entry is invalidated in every worker without explicit signalling.
+        The ``watermark`` returned pairs that version with the time of the
+        answer.
+        """
+        version = self.env["qc.dashboard.version"]._get_version()
+        scope = (
+            "all"
+            if self.env.user.has_group("smart_inventory_qc.group_qc_manager")
+            else self.env.uid
+        )
+        data = self._get_dashboard_data_cached(
+            tuple(self.env.companies.ids),
+            self.env.context.get("tz") or self.env.user.tz or "UTC",
+            fields.Date.context_today(self),
+            scope,
+            version,
+        )
+        return dict(
+            data,
+            watermark=f"{version}/{self.env.cr.now().isoformat()}",
+            recent_failures=list(data["recent_failures"]),
+        )
+
+    @api.model
+    def _parse_dashboard_watermark(self, watermark):
+        """Return the version and time of a ``watermark``, or ``(None, None)``
+        when it is not one of ours."""
         try:
-            pickings = self.env["stock.picking"].search(
-                [
-                    ("picking_type_code", "=", "incoming"),
-                    ("state", "in", ["assigned", "confirmed"]),
-                    ("qc_inspection_count", "=", 0),
-                ],
-                limit=50,
+            version, _sep, date = watermark.partition("/")
+            return int(version), datetime.fromisoformat(date)
+        except (AttributeError, TypeError, ValueError):
+            return None, None
+
+    @api.model
+    @tools.ormcache("company_ids", "tz", "today", "scope", "version")
+    def _get_dashboard_data_cached(self, company_ids, tz, today, scope, version):
+        data = self._get_dashboard_stats(today)
+        data["recent_failures"] = tuple(
+            self._read_dashboard_failures([("state", "=", "fail")], limit=5)
+        )
+        return data
+
+    @api.model
+    def _get_dashboard_failures_since(self, since):
+        """Failures changed since ``since``, give or take the overlap: the
+        caller dedupes them by id."""
+        return self._read_dashboard_failures(
+            [
+                ("state", "=", "fail"),
+                ("write_date", ">", since - DASHBOARD_FAILURE_OVERLAP),
+            ],
+            limit=50,
+        )
+
+    @api.model
+    def _read_dashboard_failures(self, domain, limit):
+        return [
+            {
+                "id": failure["id"],
+                "name": failure["name"],
+                "product": failure["product_id"] and failure["product_id"][1],
+                "inspection_date": fields.Datetime.to_string(
+                    failure["inspection_date"]
+                ),
+            }
+            for failure in self.search_read(
+                domain,
+                ["name", "product_id", "inspection_date"],
+                order="inspection_date desc",
+                limit=limit,
+            )
+        ]
+
+    @api.model
+    @instrumented("cron_auto_create_incoming_qc")
+    def cron_auto_create_incoming_qc(self, shard=0, shards=1):
+        """Create the missing inspections of incoming transfers.
+
+        Several jobs can run side by side, each with its own ``shard`` out of
+        ``shards`` of the transfers, so that even one supplier's wave of
+        receipts is spread over all of them. Each chunk is claimed with
+        ``SKIP LOCKED`` so workers never wait on each other.
+        """
+        chunk_size = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("smart_inventory_qc.auto_qc_chunk_size", 200)
+        )
+        # The cursor is not stored: set_param would clear the registry caches
+        # of every worker after each chunk. An interrupted run starts over,
+        # and the transfers it committed no longer match.
+        cursor = 0
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        created = 0
+
+        while True:
+            picking_ids = self._get_incoming_pickings_without_qc(
+                cursor, chunk_size, shard, shards
+            )
+            if not picking_ids:
+                break
+
+            created += len(
+                self._auto_create_for_pickings(
+                    self.env["stock.picking"].browse(picking_ids)
+                )
             )
 
-            for picking in pickings:
-                for move in picking.move_ids_without_package:
-                    if not move.product_id:
-                        continue
-
-                    existing = self.search(
-                        [
-                            ("picking_id", "=", picking.id),
-                            ("product_id", "=", move.product_id.id),
-                            ("state", "!=", "cancel"),
-                        ]
+            cursor = picking_ids[-1]
+            if auto_commit:
+                self.env.cr.commit()
+            self.env.invalidate_all()
+        return created
+
+    @api.model
+    def _get_incoming_pickings_without_qc(self, after_id, limit, shard=0, shards=1):
+        """Claim the next chunk of incoming transfers without inspection.
+
+        The rows stay locked until the chunk is committed. Transfers locked by
+        someone else (being confirmed, or a user's Create QC) are skipped: they
+        get their inspections there, or on the next pass.
+        """
+        self.env["stock.picking"].flush_model(
+            ["state", "picking_type_id", "partner_id", "qc_skip_lot_evaluated"]
+        )
+        self.flush_model(["picking_id"])
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT picking.id
+                  FROM stock_picking picking
+                  JOIN stock_picking_type picking_type
+                    ON picking_type.id = picking.picking_type_id
+                 WHERE picking_type.code = 'incoming'
+                   AND picking.state IN ('assigned', 'confirmed')
+                   AND picking.id > %(after_id)s
+                   AND MOD(picking.id, %(shards)s) = %(shard)s
+                   AND picking.qc_skip_lot_evaluated IS NOT TRUE
+                   AND NOT EXISTS (
+                       SELECT 1 FROM qc_inspection insp
+                        WHERE insp.picking_id = picking.id
+                   )
+              ORDER BY picking.id
+                 LIMIT %(limit)s
+                   FOR UPDATE OF picking SKIP LOCKED
+                """,
+                after_id=after_id,
+                limit=limit,
+                shard=shard,
+                shards=shards,
+            )
+        )
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _auto_create_for_pickings(self, pickings):
+        try:
+            with self.env.cr.savepoint():
+                return self._create_or_skip(
+                    pickings._filter_skipped_lots(
+                        pickings._prepare_qc_inspection_vals()
                     )
+                )
+        except Exception:
+            _logger.warning(
+                "QC auto-creation failed for a chunk of %s pickings, "
+                "retrying them one by one",
+                len(pickings),
+            )
 
-                    if not existing:
-                        self.create(
-                            {
-                                "product_id": move.product_id.id,
-                                "picking_id": picking.id,
-                                "quantity_to_inspect": move.product_uom_qty,
-                                "lot_id": move.lot_ids[0].id if move.lot_ids else False,
-                            }
+        inspections = self.browse()
+        for picking in pickings:
+            try:
+                with self.env.cr.savepoint():
+                    inspections |= self._create_or_skip(
+                        picking._filter_skipped_lots(
+                            picking._prepare_qc_inspection_vals()
                         )
-        except Exception as e:
-            self.env["ir.logging"].sudo().create(
-                {
-                    "name": "QC Auto-creation Error",
-                    "type": "server",
-                    "level": "error",
-                    "message": str(e),
-                    "path": "smart_inventory_qc.cron",
-                    "func": "cron_auto_create_incoming_qc",
-                }
+                    )
+            except Exception as e:
+                _logger.exception(
+                    "QC auto-creation failed for picking %s", picking.name
+                )
+                picking.message_post(
+                    body=f"Automatic QC inspection creation failed: {e}"
+                )
+        return inspections
+
+    @api.model
+    def _create_or_skip(self, vals_list):
+        """Create inspections in bulk, skipping the (picking, product) pairs
+        that a concurrent transaction has already inspected."""
+        self._set_checklist_templates(vals_list)
+        self._set_sampling_plans(vals_list)
+
+        high_volume_ids = set(
+            self.env["res.company"].search([("qc_high_volume_mode", "=", True)]).ids
+        )
+        groups = ([], [])
+        for vals in vals_list:
+            company_id = vals.get("company_id") or self.env.company.id
+            groups[company_id in high_volume_ids].append(vals)
+        inspections = self._create_skipping_duplicates(groups[False])
+        inspections |= self.with_context(
+            **HIGH_VOLUME_CONTEXT
+        )._create_skipping_duplicates(groups[True])
+
+        inspections._instantiate_checklists()
+        inspections._instantiate_lot_results()
+        # The regular creation log is per inspection; nothing to add there.
+        inspections._log_batch(None, "QC inspections created")
+        return inspections
+
+    @api.model
+    def _create_skipping_duplicates(self, vals_list):
+        # Pairs already inspected are skipped up front; the unique index only
+        # catches the ones a concurrent transaction has not committed yet.
+        # Each pair once: repeats within the batch are dropped below.
+        existing = self._get_active_duplicates(
+            {
+                (vals.get("picking_id"), vals.get("product_id"), "draft")
+                for vals in vals_list
+                if vals.get("state") != "cancel"
+            }
+        )
+        seen = set()
+        to_create = []
+        for vals in vals_list:
+            pair = (vals.get("picking_id"), vals.get("product_id"))
+            if vals.get("state") != "cancel" and pair[0] and pair[1]:
+                if pair in existing or pair in seen:
+                    continue
+                seen.add(pair)
+            to_create.append(vals)
+        vals_list = to_create
+        if not vals_list:
+            return self.browse()
+        try:
+            with self.env.cr.savepoint():
+                return self.create(vals_list)
+        except UniqueViolation:
+            pass
+
+        inspections = self.browse()
+        for vals in vals_list:
+            try:
+                with self.env.cr.savepoint():
+                    inspections |= self.create(vals)
+            except UniqueViolation:
+                continue
+        return inspections
+
+    @api.model
+    def _set_checklist_templates(self, vals_list):
+        products = self.env["product.product"].browse(
+            {vals["product_id"] for vals in vals_list if vals.get("product_id")}
+        )
+        templates = self.env["qc.checklist.template"]._get_for_products(products)
+        for vals in vals_list:
+            template = templates.get(vals.get("product_id"))
+            if template and "checklist_template_id" not in vals:
+                vals["checklist_template_id"] = template.id
+
+    @api.model
+    def _set_sampling_plans(self, vals_list):
+        """Replace the full lot quantity by the sample size of the product's
+        sampling plan, at the supplier's current inspection severity."""
+        vals_list = [
+            vals
+            for vals in vals_list
+            if vals.get("lot_size", 0) > 0 and "sampling_plan_id" not in vals
+        ]
+        products = self.env["product.product"].browse(
+            {vals["product_id"] for vals in vals_list if vals.get("product_id")}
+        )
+        plans = self.env["qc.sampling.plan"]._get_for_products(products)
+        if not plans:
+            return
+
+        pickings = self.env["stock.picking"].browse(
+            {vals["picking_id"] for vals in vals_list if vals.get("picking_id")}
+        )
+        partners = {picking.id: picking.partner_id.id for picking in pickings}
+        keys = [
+            (
+                partners.get(vals.get("picking_id")),
+                vals.get("product_id"),
+                vals.get("company_id", self.env.company.id) or None,
             )
+            for vals in vals_list
+        ]
+        severities = self.env["qc.supplier.quality"]._get_severities(keys)
+        for vals, key in zip(vals_list, keys):
+            plan = plans.get(vals.get("product_id"))
+            if plan:
+                vals.update(
+                    plan._get_sampling_values(
+                        vals["lot_size"], severities.get(key, "normal")
+                    )
+                )
+
+    def _instantiate_checklists(self):
+        """Copy the template checkpoints into these inspections with a single
+        INSERT ... SELECT, however many inspections and checkpoints."""
+        inspections = self.filtered("checklist_template_id")
+        if not inspections:
+            return
+        self.env["qc.checklist.template.line"].flush_model()
+        inspections.flush_recordset(["checklist_template_id"])
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_inspection_line (
+                    inspection_id, sequence, name, description,
+                    create_uid, create_date, write_uid, write_date
+                )
+                SELECT insp.id, tmpl.sequence, tmpl.name, tmpl.description,
+                       %(uid)s, NOW() AT TIME ZONE 'UTC',
+                       %(uid)s, NOW() AT TIME ZONE 'UTC'
+                  FROM qc_inspection insp
+                  JOIN qc_checklist_template_line tmpl
+                    ON tmpl.template_id = insp.checklist_template_id
+                 WHERE insp.id = ANY(%(ids)s)
+              ORDER BY insp.id, tmpl.sequence, tmpl.id
+                """,
+                uid=self.env.uid,
+                ids=inspections.ids,
+            )
+        )
+        inspections.invalidate_recordset(["checklist_ids"])
+        inspections.modified(["checklist_ids"])
+
+    def _instantiate_lot_results(self):
+        """Fan per-lot inspections out over the lots/serials of their transfer
+        with one INSERT ... SELECT. Sampled inspections keep an evenly spaced
+        (systematic) sample of quantity_to_inspect lots, drawn once; every-lot
+        inspections pick up lots entered since the last call."""
+        inspections = self.filtered(
+            lambda r: r.picking_id and r.lot_inspection_mode in ("all", "sample")
+        )
+        if not inspections:
+            return
+        self.env["stock.move.line"].flush_model(["picking_id", "product_id", "lot_id"])
+        self.env["qc.inspection.lot"].flush_model(["inspection_id"])
+        inspections.flush_recordset(
+            ["picking_id", "product_id", "lot_inspection_mode", "quantity_to_inspect"]
+        )
+        self.env.cr.execute(
+            SQL(
+                """
+                WITH lots AS (
+                    SELECT DISTINCT insp.id AS inspection_id,
+                           sml.lot_id,
+                           insp.lot_inspection_mode AS mode,
+                           CEIL(insp.quantity_to_inspect)::bigint AS sample
+                      FROM qc_inspection insp
+                      JOIN stock_move_line sml
+                        ON sml.picking_id = insp.picking_id
+                       AND sml.product_id = insp.product_id
+                     WHERE insp.id = ANY(%(ids)s)
+                       AND sml.lot_id IS NOT NULL
+                       AND (
+                           insp.lot_inspection_mode = 'all'
+                           OR NOT EXISTS (
+                               SELECT 1 FROM qc_inspection_lot done
+                                WHERE done.inspection_id = insp.id
+                           )
+                       )
+                ), ranked AS (
+                    SELECT lots.*,
+                           ROW_NUMBER() OVER w - 1 AS position,
+                           COUNT(*) OVER (PARTITION BY inspection_id) AS total
+                      FROM lots
+                    WINDOW w AS (PARTITION BY inspection_id ORDER BY lot_id)
+                )
+                INSERT INTO qc_inspection_lot (inspection_id, lot_id)
+                SELECT inspection_id, lot_id
+                  FROM ranked
+                 WHERE mode = 'all' OR MOD(position * sample, total) < sample
+                ON CONFLICT (inspection_id, lot_id) DO NOTHING
+                """,
+                ids=inspections.ids,
+            )
+        )
+        self.env["qc.inspection.lot"].invalidate_model()
+        inspections.invalidate_recordset(["lot_result_ids"])
+        inspections.modified(["lot_result_ids"])
 
 
 class QCInspectionLine(models.Model):
@@ -330,3 +1191,46 @@ class QCInspectionLine(models.Model):
     )
 
     remarks = fields.Text(string="Remarks")
+
+
+class QCInspectionLot(models.Model):
+    _name = "qc.inspection.lot"
+    _description = "QC Inspection Lot/Serial Result"
+    _order = "id"
+    # Receipts can carry tens of thousands of serials: keep the rows narrow.
+    _log_access = False
+
+    inspection_id = fields.Many2one(
+        "qc.inspection",
+        string="Inspection",
+        required=True,
+        ondelete="cascade",
+        index=True,
+        readonly=True,
+    )
+
+    lot_id = fields.Many2one(
+        "stock.lot",
+        string="Lot/Serial Number",
+        required=True,
+        ondelete="restrict",
+        readonly=True,
+    )
+
+    result = fields.Selection(
+        [
+            ("pass", "Pass"),
+            ("fail", "Fail"),
+        ],
+        string="Result",
+    )
+
+    remarks = fields.Char(string="Remarks")
+
+    _sql_constraints = [
+        (
+            "inspection_lot_uniq",
+            "UNIQUE(inspection_id, lot_id)",
+            "A lot/serial number can only be inspected once per inspection!",
+        ),
+    ]
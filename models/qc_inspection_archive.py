@@ -0,0 +1,302 @@
+import logging
+import threading
+from datetime import timedelta
+
+from markupsafe import Markup
+
+from odoo import api, fields, models, tools
+from odoo.tools import SQL
+
+from ..tools.metrics import instrumented
+from .qc_sampling_plan import SEVERITY_SELECTION
+
+_logger = logging.getLogger(__name__)
+
+# Columns copied as-is from qc_inspection.
+ARCHIVED_COLUMNS = [
+    "name",
+    "product_id",
+    "lot_id",
+    "inspector_id",
+    "inspection_date",
+    "picking_id",
+    "partner_id",
+    "company_id",
+    "state",
+    "quantity_to_inspect",
+    "quantity_accepted",
+    "quantity_rejected",
+    "pass_rate",
+    "quality_rating",
+    "lot_size",
+    "inspection_severity",
+    "acceptance_number",
+    "rejection_number",
+    "checklist_total",
+    "checklist_done",
+    "checklist_failed",
+    "checklist_progress",
+    "notes",
+]
+
+
+class QCInspectionArchive(models.Model):
+    _name = "qc.inspection.archive"
+    _description = "Archived QC Inspection"
+    _order = "inspection_date desc, id desc"
+    _log_access = False
+
+    original_id = fields.Integer(string="Original ID", readonly=True, index=True)
+
+    name = fields.Char(string="Reference", readonly=True)
+
+    product_id = fields.Many2one(
+        "product.product", string="Product", readonly=True, index=True
+    )
+
+    lot_id = fields.Many2one("stock.lot", string="Lot/Serial Number", readonly=True)
+
+    inspector_id = fields.Many2one("res.users", string="Inspector", readonly=True)
+
+    inspection_date = fields.Datetime(
+        string="Inspection Date", readonly=True, index=True
+    )
+
+    picking_id = fields.Many2one(
+        "stock.picking", string="Source Transfer", readonly=True, index=True
+    )
+
+    partner_id = fields.Many2one("res.partner", string="Supplier", readonly=True)
+
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+
+    state = fields.Selection(
+        [
+            ("pass", "Passed"),
+            ("fail", "Failed"),
+            ("cancel", "Cancelled"),
+        ],
+        readonly=True,
+    )
+
+    quantity_to_inspect = fields.Float(
+        string="Quantity to Inspect", digits="Product Unit of Measure", readonly=True
+    )
+
+    quantity_accepted = fields.Float(
+        string="Quantity Accepted", digits="Product Unit of Measure", readonly=True
+    )
+
+    quantity_rejected = fields.Float(
+        string="Quantity Rejected", digits="Product Unit of Measure", readonly=True
+    )
+
+    pass_rate = fields.Float(string="Pass Rate %", readonly=True, aggregator="avg")
+
+    quality_rating = fields.Selection(
+        [
+            ("excellent", "Excellent"),
+            ("good", "Good"),
+            ("fair", "Fair"),
+            ("poor", "Poor"),
+        ],
+        readonly=True,
+    )
+
+    lot_size = fields.Float(
+        string="Lot Size", digits="Product Unit of Measure", readonly=True
+    )
+
+    inspection_severity = fields.Selection(
+        SEVERITY_SELECTION, string="Inspection Severity", readonly=True
+    )
+
+    acceptance_number = fields.Integer(string="Acceptance Number", readonly=True)
+
+    rejection_number = fields.Integer(string="Rejection Number", readonly=True)
+
+    checklist_total = fields.Integer(string="Checkpoints", readonly=True)
+
+    checklist_done = fields.Integer(string="Completed Checkpoints", readonly=True)
+
+    checklist_failed = fields.Integer(string="Failed Checkpoints", readonly=True)
+
+    checklist_progress = fields.Float(
+        string="Checklist Progress", readonly=True, aggregator="avg"
+    )
+
+    notes = fields.Text(string="Inspection Notes", readonly=True)
+
+    checklist = fields.Json(string="Checklist Results", readonly=True)
+
+    lot_results = fields.Json(string="Lot/Serial Results", readonly=True)
+
+    results_html = fields.Html(
+        string="Results", compute="_compute_results_html", sanitize=False
+    )
+
+    archived_on = fields.Datetime(string="Archived On", readonly=True)
+
+    def init(self):
+        # Daily statistics buckets, refreshed on every inspection change.
+        tools.create_index(
+            self.env.cr,
+            "qc_inspection_archive_product_date_index",
+            self._table,
+            ["product_id", "inspection_date"],
+        )
+
+    @api.depends("checklist", "lot_results")
+    def _compute_results_html(self):
+        for record in self:
+            parts = []
+            for title, rows, columns in (
+                ("Checklist", record.checklist, ["name", "result", "remarks"]),
+                ("Lots/Serials", record.lot_results, ["lot", "result", "remarks"]),
+            ):
+                if not rows:
+                    continue
+                body = Markup("").join(
+                    Markup("<tr>%s</tr>")
+                    % Markup("").join(
+                        Markup("<td>%s</td>") % (row.get(column) or "")
+                        for column in columns
+                    )
+                    for row in rows
+                )
+                parts.append(
+                    Markup('<h5>%s</h5><table class="table table-sm">%s</table>')
+                    % (title, body)
+                )
+            record.results_html = Markup("").join(parts)
+
+    @api.model
+    @instrumented("qc_archive_inspections")
+    def cron_archive_inspections(self):
+        """Move completed inspections older than ``archive_after_days`` out of
+        qc_inspection, chunk by chunk, dropping their chatter and tracking."""
+        ICP = self.env["ir.config_parameter"].sudo()
+        days = int(ICP.get_param("smart_inventory_qc.archive_after_days", 365))
+        if days <= 0:
+            return 0
+        # The dashboard's monthly figures are read from the hot table.
+        days = max(days, 31)
+        chunk_size = int(ICP.get_param("smart_inventory_qc.archive_chunk_size", 1000))
+        cutoff = fields.Datetime.now() - timedelta(days=days)
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        archived = 0
+
+        while True:
+            inspection_ids = self._get_inspections_to_archive(cutoff, chunk_size)
+            if not inspection_ids:
+                break
+            self._archive_inspections(inspection_ids)
+            archived += len(inspection_ids)
+            if auto_commit:
+                self.env.cr.commit()
+            self.env.invalidate_all()
+
+        if archived:
+            _logger.info("Archived %s QC inspections older than %s", archived, cutoff)
+        return archived
+
+    @api.model
+    def _get_inspections_to_archive(self, cutoff, limit):
+        # Inspections of open transfers stay hot: the reconciliation cron and
+        # the transfer's QC status still look at them.
+        self.env["qc.inspection"].flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT insp.id
+                  FROM qc_inspection insp
+             LEFT JOIN stock_picking picking ON picking.id = insp.picking_id
+                 WHERE insp.state IN ('pass', 'fail', 'cancel')
+                   AND insp.inspection_date < %s
+                   AND (insp.picking_id IS NULL
+                        OR picking.state IN ('done', 'cancel'))
+              ORDER BY insp.id
+                 LIMIT %s
+                """,
+                cutoff,
+                limit,
+            )
+        )
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _archive_inspections(self, inspection_ids):
+        columns = SQL(", ").join(SQL.identifier(column) for column in ARCHIVED_COLUMNS)
+        source_columns = SQL(", ").join(
+            SQL.identifier("insp", column) for column in ARCHIVED_COLUMNS
+        )
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_inspection_archive (
+                    original_id, %(columns)s, checklist, lot_results, archived_on
+                )
+                SELECT insp.id, %(source_columns)s,
+                       (SELECT jsonb_agg(jsonb_build_object(
+                                   'sequence', line.sequence,
+                                   'name', line.name,
+                                   'description', line.description,
+                                   'result', line.result,
+                                   'remarks', line.remarks
+                               ) ORDER BY line.sequence, line.id)
+                          FROM qc_inspection_line line
+                         WHERE line.inspection_id = insp.id),
+                       (SELECT jsonb_agg(jsonb_build_object(
+                                   'lot', lot.name,
+                                   'result', result.result,
+                                   'remarks', result.remarks
+                               ) ORDER BY result.id)
+                          FROM qc_inspection_lot result
+                          JOIN stock_lot lot ON lot.id = result.lot_id
+                         WHERE result.inspection_id = insp.id),
+                       NOW() AT TIME ZONE 'UTC'
+                  FROM qc_inspection insp
+                 WHERE insp.id = ANY(%(ids)s)
+                """,
+                columns=columns,
+                source_columns=source_columns,
+                ids=inspection_ids,
+            )
+        )
+
+        # Chatter, tracking values and notifications cascade with the
+        # messages; attachments go through the ORM to clean the filestore.
+        for table, model_column in (
+            ("mail_message", "model"),
+            ("mail_followers", "res_model"),
+            ("mail_activity", "res_model"),
+        ):
+            self.env.cr.execute(
+                SQL(
+                    "DELETE FROM %s WHERE %s = 'qc.inspection' AND res_id = ANY(%s)",
+                    SQL.identifier(table),
+                    SQL.identifier(model_column),
+                    inspection_ids,
+                )
+            )
+        self.env["ir.attachment"].sudo().search(
+            [("res_model", "=", "qc.inspection"), ("res_id", "in", inspection_ids)]
+        ).unlink()
+
+        # Checklist lines, lot results and queued notifications cascade.
+        # Daily statistics are left as they are: they read the archive too.
+        self.env.cr.execute(
+            SQL(
+                """
+                DELETE FROM qc_inspection
+                 WHERE id = ANY(%s)
+             RETURNING picking_id
+                """,
+                inspection_ids,
+            )
+        )
+        picking_ids = {row[0] for row in self.env.cr.fetchall() if row[0]}
+        self.env["qc.inspection"].invalidate_model()
+        self.env["qc.dashboard.version"]._bump()
+        # The transfers' QC counters include their archived inspections.
+        self.env["stock.picking"].browse(picking_ids)._recompute_qc_status()
@@ -0,0 +1,206 @@
+from odoo import api, fields, models, tools
+from odoo.tools import SQL
+
+SOURCE_COLUMNS = [
+    "inspection_date",
+    "partner_id",
+    "product_id",
+    "company_id",
+    "state",
+    "quantity_to_inspect",
+    "quantity_accepted",
+    "quantity_rejected",
+]
+
+
+class QCInspectionStatDaily(models.Model):
+    _name = "qc.inspection.stat.daily"
+    _description = "Daily QC Inspection Statistics"
+    _order = "date desc, id desc"
+    _rec_name = "date"
+
+    date = fields.Date(string="Date", required=True, readonly=True, index=True)
+
+    partner_id = fields.Many2one("res.partner", string="Supplier", readonly=True)
+
+    product_id = fields.Many2one(
+        "product.product", string="Product", required=True, readonly=True
+    )
+
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+
+    inspection_count = fields.Integer(string="Inspections", readonly=True)
+
+    pending_count = fields.Integer(string="Pending", readonly=True)
+
+    pass_count = fields.Integer(string="Passed", readonly=True)
+
+    fail_count = fields.Integer(string="Failed", readonly=True)
+
+    cancel_count = fields.Integer(string="Cancelled", readonly=True)
+
+    quantity_inspected = fields.Float(
+        string="Quantity Inspected", digits="Product Unit of Measure", readonly=True
+    )
+
+    quantity_accepted = fields.Float(
+        string="Quantity Accepted", digits="Product Unit of Measure", readonly=True
+    )
+
+    quantity_rejected = fields.Float(
+        string="Quantity Rejected", digits="Product Unit of Measure", readonly=True
+    )
+
+    pass_rate = fields.Float(string="Pass Rate %", readonly=True, aggregator="avg")
+
+    def init(self):
+        tools.create_unique_index(
+            self.env.cr,
+            "qc_inspection_stat_daily_bucket_uniq",
+            self._table,
+            ["date", "COALESCE(partner_id, 0)", "product_id", "COALESCE(company_id, 0)"],
+        )
+
+    @api.model
+    def read_group(
+        self, domain, fields, groupby, offset=0, limit=None, orderby=False, lazy=True
+    ):
+        # Averaging daily rates would weigh a 1-unit day like a 10,000-unit one,
+        # so the grouped pass rate is rebuilt from the summed quantities.
+        if not any(spec.split(":")[0] == "pass_rate" for spec in fields):
+            return super().read_group(
+                domain, fields, groupby, offset, limit, orderby, lazy
+            )
+
+        fields = list(fields) + ["quantity_inspected:sum", "quantity_accepted:sum"]
+        groups = super().read_group(domain, fields, groupby, offset, limit, orderby, lazy)
+        for group in groups:
+            inspected = group.get("quantity_inspected") or 0.0
+            accepted = group.get("quantity_accepted") or 0.0
+            group["pass_rate"] = (accepted / inspected * 100) if inspected else 0.0
+        return groups
+
+    @api.model
+    def _refresh_buckets(self, keys):
+        """Recompute the given (date, partner_id, product_id, company_id) rows."""
+        keys = {key for key in keys if key[0] and key[2]}
+        if not keys:
+            return
+
+        self.env["qc.inspection"].flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                WITH keys(date, partner_id, product_id, company_id) AS (VALUES %s)
+                DELETE FROM qc_inspection_stat_daily stat
+                      USING keys
+                      WHERE stat.date = keys.date
+                        AND COALESCE(stat.partner_id, 0) = COALESCE(keys.partner_id, 0)
+                        AND stat.product_id = keys.product_id
+                        AND COALESCE(stat.company_id, 0) = COALESCE(keys.company_id, 0)
+                """,
+                self._get_bucket_values(keys),
+            )
+        )
+        self.env.cr.execute(self._get_upsert_query(self._get_bucket_join(keys)))
+        self.invalidate_model()
+
+    @api.model
+    def _get_bucket_values(self, keys):
+        return SQL(", ").join(
+            SQL("(%s::date, %s::int, %s::int, %s::int)", *key) for key in keys
+        )
+
+    @api.model
+    def _get_bucket_join(self, keys):
+        # Written so that each key is looked up through the
+        # (product_id, inspection_date) index of both inspection tables.
+        return SQL(
+            """
+            JOIN (VALUES %s) AS keys(date, partner_id, product_id, company_id)
+              ON insp.product_id = keys.product_id
+             AND insp.inspection_date >= keys.date
+             AND insp.inspection_date < keys.date + 1
+             AND COALESCE(insp.partner_id, 0) = COALESCE(keys.partner_id, 0)
+             AND COALESCE(insp.company_id, 0) = COALESCE(keys.company_id, 0)
+            """,
+            self._get_bucket_values(keys),
+        )
+
+    @api.model
+    def rebuild_statistics(self):
+        """Backfill the whole table from qc.inspection and its archive."""
+        self.env["qc.inspection"].flush_model()
+        self.env.cr.execute(SQL("DELETE FROM qc_inspection_stat_daily"))
+        self.env.cr.execute(self._get_upsert_query(SQL()))
+        self.invalidate_model()
+        return True
+
+    @api.model
+    def _get_upsert_query(self, join):
+        # Archived inspections keep counting: the join is applied to the hot
+        # and the archive table separately so each can use its own indexes.
+        return SQL(
+            """
+            INSERT INTO qc_inspection_stat_daily (
+                date, partner_id, product_id, company_id,
+                inspection_count, pending_count, pass_count, fail_count,
+                cancel_count, quantity_inspected, quantity_accepted,
+                quantity_rejected, pass_rate,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT agg.*,
+                   CASE WHEN agg.quantity_inspected > 0
+                        THEN agg.quantity_accepted / agg.quantity_inspected * 100
+                        ELSE 0 END,
+                   %(uid)s, NOW() AT TIME ZONE 'UTC',
+                   %(uid)s, NOW() AT TIME ZONE 'UTC'
+              FROM (
+                SELECT insp.inspection_date::date AS date,
+                       insp.partner_id,
+                       insp.product_id,
+                       insp.company_id,
+                       COUNT(*) AS inspection_count,
+                       COUNT(*) FILTER (
+                           WHERE insp.state IN ('draft', 'in_progress')
+                       ) AS pending_count,
+                       COUNT(*) FILTER (WHERE insp.state = 'pass') AS pass_count,
+                       COUNT(*) FILTER (WHERE insp.state = 'fail') AS fail_count,
+                       COUNT(*) FILTER (WHERE insp.state = 'cancel') AS cancel_count,
+                       COALESCE(SUM(insp.quantity_to_inspect) FILTER (
+                           WHERE insp.state IN ('pass', 'fail')
+                       ), 0) AS quantity_inspected,
+                       COALESCE(SUM(insp.quantity_accepted) FILTER (
+                           WHERE insp.state IN ('pass', 'fail')
+                       ), 0) AS quantity_accepted,
+                       COALESCE(SUM(insp.quantity_rejected) FILTER (
+                           WHERE insp.state IN ('pass', 'fail')
+                       ), 0) AS quantity_rejected
+                  FROM (
+                      SELECT %(columns)s FROM qc_inspection insp %(join)s
+                      UNION ALL
+                      SELECT %(columns)s FROM qc_inspection_archive insp %(join)s
+                  ) insp
+              GROUP BY 1, 2, 3, 4
+              ) agg
+            ON CONFLICT (
+                date, COALESCE(partner_id, 0), product_id, COALESCE(company_id, 0)
+            ) DO UPDATE SET
+                inspection_count = EXCLUDED.inspection_count,
+                pending_count = EXCLUDED.pending_count,
+                pass_count = EXCLUDED.pass_count,
+                fail_count = EXCLUDED.fail_count,
+                cancel_count = EXCLUDED.cancel_count,
+                quantity_inspected = EXCLUDED.quantity_inspected,
+                quantity_accepted = EXCLUDED.quantity_accepted,
+                quantity_rejected = EXCLUDED.quantity_rejected,
+                pass_rate = EXCLUDED.pass_rate,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            """,
+            uid=self.env.uid,
+            join=join,
+            columns=SQL(", ").join(
+                SQL.identifier("insp", column) for column in SOURCE_COLUMNS
+            ),
+        )
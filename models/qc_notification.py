@@ -0,0 +1,71 @@
+from collections import defaultdict
+
+from odoo import api, fields, models
+
+
+class QCNotification(models.Model):
+    _name = "qc.notification"
+    _description = "Queued QC Result Notification"
+    _order = "partner_id, id"
+
+    inspection_id = fields.Many2one(
+        "qc.inspection", string="Inspection", required=True, ondelete="cascade"
+    )
+
+    partner_id = fields.Many2one(
+        "res.partner", string="Supplier", required=True, ondelete="cascade"
+    )
+
+    @api.model
+    def cron_send_notifications(self):
+        """Send queued results, one digest per supplier for this window."""
+        batch_size = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("smart_inventory_qc.notification_batch_size", 1000)
+        )
+        notifications = self.search([], limit=batch_size)
+        if not notifications:
+            return
+
+        template = self.env.ref(
+            "smart_inventory_qc.email_qc_result", raise_if_not_found=False
+        )
+        inspection_ids_by_partner = defaultdict(list)
+        for notification in notifications:
+            inspection_ids_by_partner[notification.partner_id].append(
+                notification.inspection_id.id
+            )
+
+        single_ids = []
+        digest_vals = []
+        for partner, inspection_ids in inspection_ids_by_partner.items():
+            inspections = self.env["qc.inspection"].browse(inspection_ids)
+            if len(inspections) == 1:
+                single_ids.append(inspections.id)
+            elif partner.email:
+                digest_vals.append(self._prepare_digest_vals(partner, inspections))
+
+        if template and single_ids:
+            template.send_mail_batch(single_ids)
+        if digest_vals:
+            self.env["mail.mail"].sudo().create(digest_vals)
+        notifications.unlink()
+
+        if len(notifications) == batch_size:
+            self.env.ref("smart_inventory_qc.cron_qc_notifications")._trigger()
+
+    @api.model
+    def _prepare_digest_vals(self, partner, inspections):
+        company = inspections[0].company_id or self.env.company
+        body = self.env["ir.qweb"]._render(
+            "smart_inventory_qc.email_qc_result_digest",
+            {"partner": partner, "inspections": inspections, "company": company},
+        )
+        return {
+            "subject": f"QC Results: {len(inspections)} inspections",
+            "body_html": body,
+            "email_from": company.email_formatted or self.env.user.email_formatted,
+            "recipient_ids": [(4, partner.id)],
+            "auto_delete": True,
+        }
@@ -0,0 +1,71 @@
+from odoo import api, fields, models
+
+
+class QCProductRuleMixin(models.AbstractModel):
+    _name = "qc.product.rule.mixin"
+    _description = "QC Rule Applicable to Products"
+    _order = "sequence, id"
+    # Whether a rule without product nor category applies to every product.
+    _generic_rule = False
+
+    sequence = fields.Integer(default=10)
+
+    active = fields.Boolean(default=True)
+
+    product_id = fields.Many2one(
+        "product.product",
+        string="Product",
+        help="Applies to this product. Takes precedence over category rules.",
+    )
+
+    categ_id = fields.Many2one(
+        "product.category",
+        string="Product Category",
+        help="Applies to products in this category or its sub-categories.",
+    )
+
+    company_id = fields.Many2one(
+        "res.company", string="Company", default=lambda self: self.env.company
+    )
+
+    @api.model
+    def _get_for_products(self, products):
+        """Map product ids to the rule to apply: the product's own rule first,
+        then the closest category up the hierarchy, then a generic rule when
+        the model allows them."""
+        domain = [
+            ("company_id", "in", [False, *self.env.companies.ids]),
+            "|",
+            ("product_id", "in", products.ids),
+            ("categ_id", "parent_of", products.categ_id.ids),
+        ]
+        if self._generic_rule:
+            domain[1:1] = ["|"]
+            domain += ["&", ("product_id", "=", False), ("categ_id", "=", False)]
+        rules = self.search(domain)
+        by_product = {}
+        by_categ = {}
+        for rule in rules:
+            if rule.product_id:
+                by_product.setdefault(rule.product_id.id, rule)
+            else:
+                by_categ.setdefault(rule.categ_id.id, rule)
+
+        result = {}
+        for product in products:
+            rule = by_product.get(product.id)
+            if not rule and product.categ_id:
+                categ_ids = product.categ_id.parent_path.strip("/").split("/")
+                rule = next(
+                    (
+                        by_categ[int(categ_id)]
+                        for categ_id in reversed(categ_ids)
+                        if int(categ_id) in by_categ
+                    ),
+                    None,
+                )
+            if not rule and self._generic_rule:
+                rule = by_categ.get(False)
+            if rule:
+                result[product.id] = rule
+        return result
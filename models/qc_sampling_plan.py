@@ -0,0 +1,338 @@
+from collections import defaultdict
+
+from odoo import api, fields, models, tools
+from odoo.tools import SQL
+
+from ..tools import aql
+
+LOT_INSPECTION_MODES = [
+    ("first", "First Lot Only"),
+    ("all", "Every Lot/Serial"),
+    ("sample", "Sample of Lots/Serials"),
+]
+
+SEVERITY_SELECTION = [
+    ("normal", "Normal"),
+    ("tightened", "Tightened"),
+    ("reduced", "Reduced"),
+]
+
+
+class QCSamplingPlan(models.Model):
+    _name = "qc.sampling.plan"
+    _inherit = ["qc.product.rule.mixin"]
+    _description = "QC Sampling Plan"
+    _generic_rule = True
+
+    name = fields.Char(string="Plan Name", required=True)
+
+    categ_id = fields.Many2one(
+        help="Applies to products in this category or its sub-categories. "
+        "Leave both product and category empty to apply to all products."
+    )
+
+    inspection_level = fields.Selection(
+        [(level, level) for level in aql.LEVELS],
+        string="Inspection Level",
+        required=True,
+        default="II",
+    )
+
+    aql = fields.Selection(
+        [(value, value) for value in aql.AQL_VALUES],
+        string="AQL (%)",
+        required=True,
+        default="1.0",
+        help="Acceptable quality limit, in percent nonconforming.",
+    )
+
+    lot_inspection_mode = fields.Selection(
+        LOT_INSPECTION_MODES,
+        string="Lots/Serials",
+        required=True,
+        default="first",
+        help="For tracked products: record a result for every lot/serial "
+        "number of the receipt, or for an evenly spaced sample of them.",
+    )
+
+    def _get_sampling_values(self, lot_size, severity="normal"):
+        """Inspection values sampling a lot of ``lot_size`` units."""
+        self.ensure_one()
+        letter, sample_size, acceptance, rejection = aql.get_plan(
+            lot_size, self.inspection_level, self.aql, severity
+        )
+        if self.lot_inspection_mode == "all":
+            # 100% inspection: the plan's acceptance numbers are for its
+            # sample size, a whole lot accepts no nonconforming unit.
+            sample_size, acceptance, rejection = lot_size, 0, 1
+        return {
+            "sampling_plan_id": self.id,
+            "lot_inspection_mode": self.lot_inspection_mode,
+            "lot_size": lot_size,
+            "quantity_to_inspect": sample_size,
+            "sample_code_letter": letter,
+            "inspection_severity": severity,
+            "acceptance_number": acceptance,
+            "rejection_number": rejection,
+        }
+
+
+class QCSupplierQuality(models.Model):
+    _name = "qc.supplier.quality"
+    _description = "QC Supplier Quality History"
+    _rec_name = "partner_id"
+    _order = "partner_id, product_id"
+
+    partner_id = fields.Many2one(
+        "res.partner", string="Supplier", required=True, readonly=True
+    )
+
+    product_id = fields.Many2one(
+        "product.product", string="Product", required=True, readonly=True
+    )
+
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+
+    severity = fields.Selection(
+        SEVERITY_SELECTION, string="Inspection Severity", required=True, default="normal"
+    )
+
+    recent_results = fields.Char(
+        string="Recent Lots",
+        readonly=True,
+        default="",
+        help="Outcome of the last sampled lots since the current severity "
+        "started, oldest first: A for accepted, R for rejected.",
+    )
+
+    switching_score = fields.Integer(string="Switching Score", readonly=True)
+
+    lot_count = fields.Integer(string="Completed Lots", readonly=True)
+
+    rolling_pass_rate = fields.Float(
+        string="Rolling Pass Rate %",
+        readonly=True,
+        help="Exponentially weighted average of the pass rate of completed "
+        "inspections, updated as each one completes.",
+    )
+
+    pass_streak = fields.Integer(string="Pass Streak", readonly=True)
+
+    skip_lot_active = fields.Boolean(
+        string="Skip-Lot",
+        readonly=True,
+        help="Trusted pair: only a fraction of its receipts are inspected. Any "
+        "failed inspection switches it back to full inspection.",
+    )
+
+    skip_lot_counter = fields.Integer(
+        string="Lots Since Last Inspection", readonly=True
+    )
+
+    skipped_lot_count = fields.Integer(string="Skipped Lots", readonly=True)
+
+    def init(self):
+        tools.create_unique_index(
+            self.env.cr,
+            "qc_supplier_quality_key_uniq",
+            self._table,
+            ["partner_id", "product_id", "COALESCE(company_id, 0)"],
+        )
+
+    def _get_key(self):
+        return (self.partner_id.id, self.product_id.id, self.company_id.id or None)
+
+    @api.model
+    def _get_by_keys(self, keys):
+        """Map the existing (partner_id, product_id, company_id) keys to
+        their record, in one search."""
+        keys = {key for key in keys if key[0] and key[1]}
+        if not keys:
+            return {}
+        records = self.search(
+            [
+                ("partner_id", "in", [key[0] for key in keys]),
+                ("product_id", "in", [key[1] for key in keys]),
+            ]
+        )
+        return {
+            record._get_key(): record
+            for record in records
+            if record._get_key() in keys
+        }
+
+    @api.model
+    def _get_severities(self, keys):
+        """Map (partner_id, product_id, company_id) keys to their severity."""
+        return {key: record.severity for key, record in self._get_by_keys(keys).items()}
+
+    @api.model
+    def _decide_skip_lots(self, keys):
+        """Return, for each lot key in order, whether skip-lot lets it
+        through uninspected. Trusted pairs inspect one lot in
+        ``skip_lot_frequency``."""
+        frequency = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("smart_inventory_qc.skip_lot_frequency", 4)
+        )
+        trusted = {
+            key: record
+            for key, record in self._get_by_keys(keys).items()
+            if record.skip_lot_active
+        }
+        if frequency <= 1 or not trusted:
+            return [False] * len(keys)
+
+        # Receipts of one supplier are confirmed and claimed by several
+        # workers: take turns on its counters instead of losing updates.
+        records = self.browse(record.id for record in trusted.values())
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT id FROM qc_supplier_quality
+                 WHERE id = ANY(%s)
+              ORDER BY id
+                   FOR UPDATE
+                """,
+                records.ids,
+            )
+        )
+        records.invalidate_recordset(
+            ["skip_lot_active", "skip_lot_counter", "skipped_lot_count"]
+        )
+        trusted = {
+            key: record for key, record in trusted.items() if record.skip_lot_active
+        }
+        if not trusted:
+            return [False] * len(keys)
+
+        counters = {key: record.skip_lot_counter for key, record in trusted.items()}
+        skipped = defaultdict(int)
+        decisions = []
+        for key in keys:
+            skip = key in counters and counters[key] + 1 < frequency
+            if skip:
+                counters[key] += 1
+                skipped[key] += 1
+            elif key in counters:
+                counters[key] = 0
+            decisions.append(skip)
+
+        for key, record in trusted.items():
+            record.write(
+                {
+                    "skip_lot_counter": counters[key],
+                    "skipped_lot_count": record.skipped_lot_count + skipped[key],
+                }
+            )
+        return decisions
+
+    @api.model
+    def _record_results(self, inspections):
+        """Fold these completed inspections into their supplier's history,
+        oldest first: rolling pass rate and streak for skip-lot, and the
+        ISO 2859-1 switching rules for sampled lots."""
+        inspections = inspections.filtered("partner_id").sorted(
+            lambda r: (r.inspection_date, r.id)
+        )
+        if not inspections:
+            return
+
+        keys = {
+            (insp.partner_id.id, insp.product_id.id, insp.company_id.id or None)
+            for insp in inspections
+        }
+        records = self._get_by_keys(keys)
+        missing = keys - records.keys()
+        for record in self.create(
+            [
+                {"partner_id": partner, "product_id": product, "company_id": company}
+                for partner, product, company in missing
+            ]
+        ):
+            records[record._get_key()] = record
+
+        states = {
+            key: {fname: records[key][fname] for fname in self._get_history_fields()}
+            for key in keys
+        }
+        ICP = self.env["ir.config_parameter"].sudo()
+        params = {
+            "smoothing": float(
+                ICP.get_param("smart_inventory_qc.skip_lot_smoothing", 0.1)
+            ),
+            "min_streak": int(
+                ICP.get_param("smart_inventory_qc.skip_lot_min_streak", 10)
+            ),
+            "min_pass_rate": float(
+                ICP.get_param("smart_inventory_qc.skip_lot_min_pass_rate", 98.0)
+            ),
+        }
+        for insp in inspections:
+            key = (insp.partner_id.id, insp.product_id.id, insp.company_id.id or None)
+            accepted = insp.state == "pass"
+            self._update_skip_lot(states[key], accepted, insp.pass_rate, params)
+            if insp.sampling_plan_id:
+                self._switch(states[key], accepted, insp.acceptance_number)
+
+        for key, state in states.items():
+            if any(records[key][fname] != value for fname, value in state.items()):
+                records[key].write(state)
+
+    @api.model
+    def _get_history_fields(self):
+        return [
+            "severity",
+            "recent_results",
+            "switching_score",
+            "lot_count",
+            "rolling_pass_rate",
+            "pass_streak",
+            "skip_lot_active",
+            "skip_lot_counter",
+        ]
+
+    @api.model
+    def _update_skip_lot(self, state, accepted, pass_rate, params):
+        if state["lot_count"]:
+            smoothing = params["smoothing"]
+            rolling = smoothing * pass_rate + (1 - smoothing) * state["rolling_pass_rate"]
+        else:
+            rolling = pass_rate
+        streak = state["pass_streak"] + 1 if accepted else 0
+        trusted = (
+            accepted
+            and streak >= params["min_streak"]
+            and rolling >= params["min_pass_rate"]
+        )
+        state.update(
+            lot_count=state["lot_count"] + 1,
+            rolling_pass_rate=rolling,
+            pass_streak=streak,
+            skip_lot_active=trusted,
+            skip_lot_counter=state["skip_lot_counter"] if trusted else 0,
+        )
+
+    @api.model
+    def _switch(self, state, accepted, acceptance_number):
+        severity = state["severity"]
+        recent = ((state["recent_results"] or "") + ("A" if accepted else "R"))[-5:]
+        score = state["switching_score"]
+        if severity == "normal":
+            if recent.count("R") >= 2:
+                severity, recent, score = "tightened", "", 0
+            elif not accepted:
+                score = 0
+            else:
+                # Simplified switching score: plans accepting two or more
+                # nonconforming units earn 3 points per accepted lot.
+                score += 3 if acceptance_number >= 2 else 2
+                if score >= 30:
+                    severity, recent, score = "reduced", "", 0
+        elif severity == "tightened":
+            if recent == "AAAAA":
+                severity, recent, score = "normal", "", 0
+        elif not accepted:
+            severity, recent, score = "normal", "", 0
+        state.update(severity=severity, recent_results=recent, switching_score=score)
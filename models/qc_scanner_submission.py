@@ -0,0 +1,296 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+VERDICTS = {"pass": "action_pass", "fail": "action_fail"}
+
+CHECKLIST_RESULTS = {"pass", "fail", "na"}
+
+LOT_RESULTS = {"pass", "fail"}
+
+
+class QCScannerSubmission(models.Model):
+    _name = "qc.scanner.submission"
+    _description = "QC Scanner Submission"
+    _order = "id desc"
+
+    uuid = fields.Char(string="Submission ID", required=True, readonly=True)
+
+    user_id = fields.Many2one(
+        "res.users",
+        string="Inspector",
+        required=True,
+        readonly=True,
+        default=lambda self: self.env.user,
+    )
+
+    inspection_id = fields.Many2one(
+        "qc.inspection", string="Inspection", readonly=True, ondelete="set null"
+    )
+
+    result = fields.Json(string="Result", readonly=True)
+
+    _sql_constraints = [
+        (
+            "uuid_uniq",
+            "UNIQUE(uuid)",
+            "A scanner submission can only be applied once!",
+        ),
+    ]
+
+    @api.model
+    def _process_batch(self, items):
+        """Apply a batch of scanner submissions and return one result per
+        item, in order.
+
+        Each item carries a client-generated ``uuid``, the ``inspection_id``,
+        and optionally ``quantity_accepted``, ``quantity_rejected``,
+        ``lines`` (``{"id", "result", "remarks"}``), ``lots`` (scanned
+        ``{"lot", "result", "remarks"}``) and a ``verdict`` (pass/fail).
+        Valid items are applied together with grouped writes; if that fails,
+        they are retried one by one so a bad item cannot block the others.
+        Replaying an applied ``uuid`` returns its stored result.
+        """
+        results = [None] * len(items)
+        uuids = [
+            item["uuid"]
+            for item in items
+            if isinstance(item, dict) and isinstance(item.get("uuid"), str)
+        ]
+        # Look beyond the user's own submissions to report reused uuids.
+        applied = {
+            submission.uuid: submission
+            for submission in self.sudo().search([("uuid", "in", uuids)])
+        }
+
+        valid = []
+        seen_uuids = set()
+        seen_inspections = set()
+        for index, item in enumerate(items):
+            error = self._validate_item(item, applied, seen_uuids, seen_inspections)
+            if isinstance(error, dict):
+                results[index] = error
+            elif error:
+                results[index] = {
+                    "uuid": item.get("uuid") if isinstance(item, dict) else None,
+                    "status": "error",
+                    "error": error,
+                }
+            else:
+                valid.append((index, item))
+        if not valid:
+            return results
+
+        self._prepare_items([item for _index, item in valid])
+        try:
+            with self.env.cr.savepoint():
+                applied_results = self._apply_items([item for _index, item in valid])
+        except Exception:
+            _logger.info(
+                "Scanner batch of %s submissions failed, applying them one by one",
+                len(valid),
+            )
+            applied_results = []
+            for _index, item in valid:
+                try:
+                    with self.env.cr.savepoint():
+                        applied_results += self._apply_items([item])
+                except Exception as e:
+                    applied_results.append(
+                        {"uuid": item["uuid"], "status": "error", "error": str(e)}
+                    )
+        for (index, _item), result in zip(valid, applied_results):
+            results[index] = result
+        return results
+
+    @api.model
+    def _validate_item(self, item, applied, seen_uuids, seen_inspections):
+        """Return an error message, the stored result of a replayed item, or
+        nothing when the item can be applied."""
+        if not isinstance(item, dict) or not isinstance(item.get("uuid"), str):
+            return "Missing submission uuid"
+        uuid = item["uuid"]
+        if uuid in applied:
+            if applied[uuid].user_id != self.env.user:
+                return "Submission uuid already used by another user"
+            return dict(applied[uuid].result, replayed=True)
+        if uuid in seen_uuids:
+            return "Submission uuid repeated in this batch"
+        seen_uuids.add(uuid)
+
+        inspection_id = item.get("inspection_id")
+        if not isinstance(inspection_id, int):
+            return "Missing inspection_id"
+        if inspection_id in seen_inspections:
+            return "Inspection submitted twice in this batch"
+        seen_inspections.add(inspection_id)
+
+        for fname in ("quantity_accepted", "quantity_rejected"):
+            quantity = item.get(fname)
+            if quantity is not None and (
+                not isinstance(quantity, (int, float)) or quantity < 0
+            ):
+                return f"Invalid {fname}"
+        if item.get("verdict") not in (None, *VERDICTS):
+            return f"Invalid verdict {item['verdict']!r}"
+        for line in item.get("lines") or []:
+            if not isinstance(line, dict) or not isinstance(line.get("id"), int):
+                return "Checklist line without id"
+            if line.get("result") not in (None, *CHECKLIST_RESULTS):
+                return f"Invalid checklist result {line['result']!r}"
+        for lot in item.get("lots") or []:
+            if not isinstance(lot, dict) or not lot.get("lot"):
+                return "Lot/serial scan without lot"
+            if lot.get("result") not in (None, *LOT_RESULTS):
+                return f"Invalid lot/serial result {lot['result']!r}"
+        return None
+
+    @api.model
+    def _prepare_items(self, items):
+        """Resolve the inspections, checklist lines and scanned lots of the
+        items in three searches, storing per-item errors for what does not
+        belong to the inspection."""
+        inspections = self.env["qc.inspection"].browse(
+            item["inspection_id"] for item in items
+        ).exists()
+        inspections = inspections._filtered_access("write")
+        line_ids = [line["id"] for item in items for line in item.get("lines") or []]
+        line_inspections = {
+            line["id"]: line["inspection_id"][0]
+            for line in self.env["qc.inspection.line"].search_read(
+                [("id", "in", line_ids), ("inspection_id", "in", inspections.ids)],
+                ["inspection_id"],
+            )
+        }
+        lot_names = [lot["lot"] for item in items for lot in item.get("lots") or []]
+        lot_results = {
+            (result.inspection_id.id, result.lot_id.name): result.id
+            for result in self.env["qc.inspection.lot"].search(
+                [
+                    ("inspection_id", "in", inspections.ids),
+                    ("lot_id.name", "in", lot_names),
+                ]
+            )
+        }
+
+        for item in items:
+            inspection = inspections.browse(item["inspection_id"])
+            item["_error"] = None
+            if inspection not in inspections:
+                item["_error"] = "Inspection not found"
+                continue
+            if inspection.state not in ("draft", "in_progress"):
+                item["_error"] = f"Inspection {inspection.name} is already completed"
+                continue
+            for line in item.get("lines") or []:
+                if line_inspections.get(line["id"]) != inspection.id:
+                    item["_error"] = f"Checklist line {line['id']} not found"
+                    break
+            for lot in item.get("lots") or []:
+                lot["_id"] = lot_results.get((inspection.id, lot["lot"]))
+                if not lot["_id"]:
+                    item["_error"] = (
+                        f"Lot/serial {lot['lot']} is not part of {inspection.name}"
+                    )
+                    break
+
+    @api.model
+    def _apply_items(self, items):
+        """Apply prepared items with one write per distinct set of values,
+        then record them as applied."""
+        results = {}
+        to_apply = []
+        for item in items:
+            if item["_error"]:
+                results[item["uuid"]] = {
+                    "uuid": item["uuid"],
+                    "status": "error",
+                    "error": item["_error"],
+                }
+            else:
+                to_apply.append(item)
+
+        Inspection = self.env["qc.inspection"]
+        inspections = Inspection.browse(item["inspection_id"] for item in to_apply)
+        inspections.filtered(lambda r: r.state == "draft").action_start_inspection()
+
+        inspection_vals = {}
+        line_vals = {}
+        lot_vals = {}
+        for item in to_apply:
+            inspection_vals[item["inspection_id"]] = {
+                fname: item[fname]
+                for fname in ("quantity_accepted", "quantity_rejected")
+                if item.get(fname) is not None
+            }
+            for line in item.get("lines") or []:
+                line_vals[line["id"]] = {
+                    fname: line[fname]
+                    for fname in ("result", "remarks")
+                    if fname in line
+                }
+            for lot in item.get("lots") or []:
+                lot_vals[lot["_id"]] = {
+                    fname: lot[fname]
+                    for fname in ("result", "remarks")
+                    if fname in lot
+                }
+        self._write_grouped(Inspection, inspection_vals)
+        self._write_grouped(self.env["qc.inspection.line"], line_vals)
+        self._write_grouped(self.env["qc.inspection.lot"], lot_vals)
+
+        for verdict, action in VERDICTS.items():
+            decided = inspections.browse(
+                item["inspection_id"]
+                for item in to_apply
+                if item.get("verdict") == verdict
+            )
+            if decided:
+                getattr(decided, action)()
+
+        for item in to_apply:
+            inspection = inspections.browse(item["inspection_id"])
+            results[item["uuid"]] = {
+                "uuid": item["uuid"],
+                "status": "ok",
+                "inspection_id": inspection.id,
+                "name": inspection.name,
+                "state": inspection.state,
+            }
+        self.create(
+            [
+                {
+                    "uuid": item["uuid"],
+                    "inspection_id": item["inspection_id"],
+                    "result": results[item["uuid"]],
+                }
+                for item in to_apply
+            ]
+        )
+        return [results[item["uuid"]] for item in items]
+
+    @api.model
+    def _write_grouped(self, model, vals_by_id):
+        groups = defaultdict(list)
+        for record_id, vals in vals_by_id.items():
+            if vals:
+                groups[tuple(sorted(vals.items()))].append(record_id)
+        for vals, ids in groups.items():
+            model.browse(ids).write(dict(vals))
+
+    @api.autovacuum
+    def _gc_submissions(self):
+        """Forget applied submissions once clients can no longer replay
+        them."""
+        days = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("smart_inventory_qc.scanner_retention_days", 30)
+        )
+        self.sudo().search(
+            [("create_date", "<", fields.Datetime.now() - timedelta(days=days))]
+        ).unlink()
@@ -0,0 +1,312 @@
+import logging
+
+from odoo import api, fields, models, tools
+from odoo.tools import SQL
+
+from ..tools.metrics import instrumented
+
+try:
+    import numpy as np
+
+    from ..tools import spc
+except ImportError:
+    np = spc = None
+
+_logger = logging.getLogger(__name__)
+
+SIGNAL_KINDS = [
+    ("above_ucl", "Above Upper Control Limit"),
+    ("below_lcl", "Below Lower Control Limit"),
+    ("cusum_high", "CUSUM: Upward Shift"),
+    ("cusum_low", "CUSUM: Downward Shift"),
+]
+
+
+class QCSpcSeries(models.Model):
+    _name = "qc.spc.series"
+    _description = "QC Control Chart Series"
+    _rec_name = "partner_id"
+    _order = "out_of_control desc, partner_id, product_id"
+
+    partner_id = fields.Many2one("res.partner", string="Supplier", readonly=True)
+
+    product_id = fields.Many2one("product.product", string="Product", readonly=True)
+
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+
+    point_count = fields.Integer(string="Days", readonly=True)
+
+    date_from = fields.Date(string="First Day", readonly=True)
+
+    date_to = fields.Date(string="Last Day", readonly=True)
+
+    center_line = fields.Float(
+        string="Center Line (p̄)",
+        digits=(16, 6),
+        readonly=True,
+        help="Overall fraction nonconforming of the series, weighted by "
+        "quantity.",
+    )
+
+    last_value = fields.Float(
+        string="Last Fraction Nonconforming", digits=(16, 6), readonly=True
+    )
+
+    last_lcl = fields.Float(string="Last LCL", digits=(16, 6), readonly=True)
+
+    last_ucl = fields.Float(string="Last UCL", digits=(16, 6), readonly=True)
+
+    cusum_high = fields.Float(string="CUSUM+", digits=(16, 3), readonly=True)
+
+    cusum_low = fields.Float(string="CUSUM-", digits=(16, 3), readonly=True)
+
+    out_of_control = fields.Boolean(
+        string="Out of Control",
+        readonly=True,
+        help="The last day of the series raised a signal.",
+    )
+
+    signal_count = fields.Integer(string="Signals", readonly=True)
+
+    signal_ids = fields.One2many("qc.spc.signal", "series_id", string="Signals")
+
+    def init(self):
+        tools.create_unique_index(
+            self.env.cr,
+            "qc_spc_series_key_uniq",
+            self._table,
+            ["partner_id", "product_id", "COALESCE(company_id, 0)"],
+        )
+
+    @api.model
+    @instrumented("qc_spc_compute")
+    def cron_compute_spc(self):
+        """Recompute the p-chart and CUSUM of every supplier/product series
+        from the daily statistics, all series in one vectorized pass."""
+        if np is None:
+            _logger.warning("numpy is not installed, skipping the QC SPC job")
+            return 0
+
+        ICP = self.env["ir.config_parameter"].sudo()
+        sigma = float(ICP.get_param("smart_inventory_qc.spc_sigma", 3.0))
+        cusum_k = float(ICP.get_param("smart_inventory_qc.spc_cusum_k", 0.5))
+        cusum_h = float(ICP.get_param("smart_inventory_qc.spc_cusum_h", 5.0))
+        min_points = int(ICP.get_param("smart_inventory_qc.spc_min_points", 10))
+
+        self.env["qc.inspection.stat.daily"].flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT partner_id, product_id, COALESCE(company_id, 0), date,
+                       quantity_inspected, quantity_rejected
+                  FROM qc_inspection_stat_daily
+                 WHERE partner_id IS NOT NULL
+                   AND quantity_inspected > 0
+              ORDER BY partner_id, product_id, COALESCE(company_id, 0), date
+                """
+            )
+        )
+        rows = self.env.cr.fetchall()
+        if not rows:
+            self._replace_series([], [])
+            return 0
+
+        partners, products, companies, dates, inspected, rejected = zip(*rows)
+        del rows
+        partners = np.asarray(partners)
+        products = np.asarray(products)
+        companies = np.asarray(companies)
+        inspected = np.asarray(inspected, dtype=float)
+        rejected = np.asarray(rejected, dtype=float)
+
+        starts = spc.segment_starts(partners, products, companies)
+        segments = np.cumsum(starts) - 1
+        first = np.flatnonzero(starts)
+        last = np.append(first[1:], len(starts)) - 1
+        counts = last - first + 1
+
+        center, p, spread, lcl, ucl = spc.p_chart(inspected, rejected, segments, sigma)
+        z = spc.standardize(p, center, spread)
+        high = spc.cusum(z - cusum_k, starts, segments)
+        low = spc.cusum(-z - cusum_k, starts, segments)
+
+        # Too short a history gives meaningless limits.
+        eligible = (counts >= min_points)[segments]
+        signal_masks = {
+            "above_ucl": (p > ucl) & eligible,
+            "below_lcl": (p < lcl) & eligible,
+            "cusum_high": spc.first_crossings(high, cusum_h, starts) & eligible,
+            "cusum_low": spc.first_crossings(low, cusum_h, starts) & eligible,
+        }
+        signal_limits = {
+            "above_ucl": ucl,
+            "below_lcl": lcl,
+            "cusum_high": np.full_like(p, cusum_h),
+            "cusum_low": np.full_like(p, cusum_h),
+        }
+        signal_values = {
+            "above_ucl": p,
+            "below_lcl": p,
+            "cusum_high": high,
+            "cusum_low": low,
+        }
+
+        flagged = np.zeros(len(p), dtype=bool)
+        for mask in signal_masks.values():
+            flagged |= mask
+        signal_counts = np.bincount(segments, weights=flagged, minlength=len(first))
+
+        kept = np.flatnonzero(counts >= min_points)
+        kept_last = last[kept]
+        series = list(
+            zip(
+                partners[first[kept]].tolist(),
+                products[first[kept]].tolist(),
+                companies[first[kept]].tolist(),
+                counts[kept].tolist(),
+                [dates[i] for i in first[kept]],
+                [dates[i] for i in kept_last],
+                center[kept_last].tolist(),
+                p[kept_last].tolist(),
+                lcl[kept_last].tolist(),
+                ucl[kept_last].tolist(),
+                high[kept_last].tolist(),
+                low[kept_last].tolist(),
+                flagged[kept_last].tolist(),
+                signal_counts[kept].astype(int).tolist(),
+            )
+        )
+        signals = [
+            (
+                (partners[i].item(), products[i].item(), companies[i].item()),
+                dates[i],
+                kind,
+                signal_values[kind][i].item(),
+                signal_limits[kind][i].item(),
+            )
+            for kind, mask in signal_masks.items()
+            for i in np.flatnonzero(mask)
+        ]
+        self._replace_series(series, signals)
+        return len(series)
+
+    @api.model
+    def _replace_series(self, series, signals):
+        """Upsert the series and replace all signals, with a constant number
+        of statements whatever the volume."""
+        columns = list(zip(*series)) or [[]] * 14
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_spc_series (
+                    partner_id, product_id, company_id, point_count, date_from,
+                    date_to, center_line, last_value, last_lcl, last_ucl,
+                    cusum_high, cusum_low, out_of_control, signal_count,
+                    create_uid, create_date, write_uid, write_date
+                )
+                SELECT partner_id, product_id, NULLIF(company_id, 0), point_count,
+                       date_from, date_to, center_line, last_value, last_lcl,
+                       last_ucl, cusum_high, cusum_low, out_of_control,
+                       signal_count,
+                       %(uid)s, NOW() AT TIME ZONE 'UTC',
+                       %(uid)s, NOW() AT TIME ZONE 'UTC'
+                  FROM unnest(
+                      %(c0)s::int[], %(c1)s::int[], %(c2)s::int[], %(c3)s::int[],
+                      %(c4)s::date[], %(c5)s::date[], %(c6)s::float8[],
+                      %(c7)s::float8[], %(c8)s::float8[], %(c9)s::float8[],
+                      %(c10)s::float8[], %(c11)s::float8[], %(c12)s::bool[],
+                      %(c13)s::int[]
+                  ) AS t(
+                      partner_id, product_id, company_id, point_count, date_from,
+                      date_to, center_line, last_value, last_lcl, last_ucl,
+                      cusum_high, cusum_low, out_of_control, signal_count
+                  )
+                ON CONFLICT (partner_id, product_id, COALESCE(company_id, 0))
+                DO UPDATE SET
+                    point_count = EXCLUDED.point_count,
+                    date_from = EXCLUDED.date_from,
+                    date_to = EXCLUDED.date_to,
+                    center_line = EXCLUDED.center_line,
+                    last_value = EXCLUDED.last_value,
+                    last_lcl = EXCLUDED.last_lcl,
+                    last_ucl = EXCLUDED.last_ucl,
+                    cusum_high = EXCLUDED.cusum_high,
+                    cusum_low = EXCLUDED.cusum_low,
+                    out_of_control = EXCLUDED.out_of_control,
+                    signal_count = EXCLUDED.signal_count,
+                    write_uid = EXCLUDED.write_uid,
+                    write_date = EXCLUDED.write_date
+                RETURNING id, partner_id, product_id, COALESCE(company_id, 0)
+                """,
+                uid=self.env.uid,
+                **{f"c{index}": list(column) for index, column in enumerate(columns)},
+            )
+        )
+        series_ids = {tuple(row[1:]): row[0] for row in self.env.cr.fetchall()}
+
+        # Signals cascade with the series that are no longer computed.
+        self.env.cr.execute(
+            SQL(
+                "DELETE FROM qc_spc_series WHERE id != ALL(%s)",
+                list(series_ids.values()),
+            )
+        )
+        self.env.cr.execute(SQL("DELETE FROM qc_spc_signal"))
+        if signals:
+            keys, signal_dates, kinds, values, limits = zip(*signals)
+            self.env.cr.execute(
+                SQL(
+                    """
+                    INSERT INTO qc_spc_signal (
+                        series_id, partner_id, product_id, company_id,
+                        date, kind, value, control_limit
+                    )
+                    SELECT series.id, series.partner_id, series.product_id,
+                           series.company_id, t.date, t.kind, t.value,
+                           t.control_limit
+                      FROM unnest(
+                          %s::int[], %s::date[], %s::varchar[], %s::float8[],
+                          %s::float8[]
+                      ) AS t(series_id, date, kind, value, control_limit)
+                      JOIN qc_spc_series series ON series.id = t.series_id
+                    """,
+                    [series_ids[key] for key in keys],
+                    list(signal_dates),
+                    list(kinds),
+                    list(values),
+                    list(limits),
+                )
+            )
+        self.invalidate_model()
+        self.env["qc.spc.signal"].invalidate_model()
+
+
+class QCSpcSignal(models.Model):
+    _name = "qc.spc.signal"
+    _description = "QC Control Chart Signal"
+    _order = "date desc, id desc"
+    # Rebuilt in bulk every night: keep the rows narrow.
+    _log_access = False
+
+    series_id = fields.Many2one(
+        "qc.spc.series",
+        string="Series",
+        required=True,
+        ondelete="cascade",
+        index=True,
+        readonly=True,
+    )
+
+    partner_id = fields.Many2one("res.partner", string="Supplier", readonly=True)
+
+    product_id = fields.Many2one("product.product", string="Product", readonly=True)
+
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+
+    date = fields.Date(string="Date", readonly=True)
+
+    kind = fields.Selection(SIGNAL_KINDS, string="Signal", readonly=True)
+
+    value = fields.Float(string="Value", digits=(16, 6), readonly=True)
+
+    control_limit = fields.Float(string="Limit", digits=(16, 6), readonly=True)
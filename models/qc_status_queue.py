@@ -0,0 +1,86 @@
+import threading
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+from ..tools.metrics import instrumented
+
+
+class QCStatusQueue(models.Model):
+    _name = "qc.status.queue"
+    _description = "Queued Transfer QC Status Recomputation"
+    _order = "id"
+    # Written on every inspection transition: keep the rows narrow. The
+    # queue is append-only so that concurrent transitions on one transfer
+    # never wait on each other; duplicates are coalesced when processed.
+    _log_access = False
+
+    picking_id = fields.Many2one(
+        "stock.picking",
+        string="Transfer",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+
+    @api.model
+    def _enqueue(self, picking_ids):
+        """Queue these transfers for a QC status recomputation and wake the
+        job up."""
+        if not picking_ids:
+            return
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_status_queue (picking_id)
+                SELECT unnest(%s::int[])
+                """,
+                picking_ids,
+            )
+        )
+        cron = self.env.ref(
+            "smart_inventory_qc.cron_qc_status_queue", raise_if_not_found=False
+        )
+        if cron:
+            cron.sudo()._trigger()
+
+    @api.model
+    @instrumented("qc_status_queue")
+    def cron_process_queue(self):
+        """Recompute the QC status of the queued transfers, chunk by chunk,
+        each transfer once per chunk however often it was queued. Chunks are
+        claimed with SKIP LOCKED so overlapping runs share the queue."""
+        batch_size = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("smart_inventory_qc.status_queue_batch_size", 1000)
+        )
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        processed = 0
+
+        while True:
+            self.env.cr.execute(
+                SQL(
+                    """
+                    DELETE FROM qc_status_queue
+                     WHERE id IN (
+                         SELECT id FROM qc_status_queue
+                          ORDER BY id
+                          LIMIT %s
+                            FOR UPDATE SKIP LOCKED
+                     )
+                    RETURNING picking_id
+                    """,
+                    batch_size,
+                )
+            )
+            picking_ids = {row[0] for row in self.env.cr.fetchall()}
+            if not picking_ids:
+                break
+
+            self.env["stock.picking"].browse(picking_ids)._recompute_qc_status()
+            processed += len(picking_ids)
+            if auto_commit:
+                self.env.cr.commit()
+            self.env.invalidate_all()
+        return processed
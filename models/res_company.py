@@ -0,0 +1,13 @@
+from odoo import fields, models
+
+
+class ResCompany(models.Model):
+    _inherit = "res.company"
+
+    qc_high_volume_mode = fields.Boolean(
+        string="QC High-Volume Mode",
+        help="Skip per-field change tracking on QC inspections and log a single "
+        "summary message per transfer for creation and state changes, instead "
+        "of one message per inspection. Recommended from a few thousand "
+        "inspections a day.",
+    )
@@ -1,6 +1,10 @@
-from odoo import api, fields, models
+from collections import defaultdict
+
+from odoo import Command, api, fields, models
 from odoo.exceptions import UserError
 
+from ..tools.metrics import instrumented
+
 
 class StockPicking(models.Model):
     _inherit = "stock.picking"
@@ -9,7 +13,9 @@ class StockPicking(models.Model):
         "qc.inspection", "picking_id", string="QC Inspections"
     )
 
-    qc_inspection_count = fields.Integer(string="QC Count", compute="_compute_qc_count")
+    qc_inspection_count = fields.Integer(
+        string="QC Count", compute="_compute_qc_status", store=True
+    )
 
     qc_status = fields.Selection(
         [
@@ -28,34 +34,80 @@ class StockPicking(models.Model):
         string="Require QC", compute="_compute_require_qc", store=True
     )
 
-    @api.depends("qc_inspection_ids")
-    def _compute_qc_count(self):
-        for record in self:
-            record.qc_inspection_count = len(record.qc_inspection_ids)
+    qc_skip_lot_evaluated = fields.Boolean(
+        string="Skip-Lot Evaluated",
+        copy=False,
+        help="Skip-lot inspection already decided which products of this "
+        "transfer to inspect.",
+    )
+
+    qc_skipped_product_ids = fields.Many2many(
+        "product.product",
+        "stock_picking_qc_skipped_product_rel",
+        "picking_id",
+        "product_id",
+        string="Skip-Lot Products",
+        copy=False,
+        readonly=True,
+        help="Products skip-lot inspection let through uninspected on this "
+        "transfer.",
+    )
 
     @api.depends("picking_type_code")
     def _compute_require_qc(self):
         for record in self:
             record.require_qc = record.picking_type_code == "incoming"
 
-    @api.depends("qc_inspection_ids", "qc_inspection_ids.state")
+    # Inspection state changes are not a dependency: they queue the transfer
+    # in qc.status.queue instead of rewriting its row on every transition.
+    @api.depends("require_qc", "qc_inspection_ids")
     def _compute_qc_status(self):
-        for record in self:
-            if not record.require_qc or not record.qc_inspection_ids:
-                record.qc_status = "none"
-                continue
+        # One grouped query per model for the whole batch instead of loading
+        # every picking's inspections; archived inspections still count.
+        counts = defaultdict(lambda: defaultdict(int))
+        for model in ("qc.inspection", "qc.inspection.archive"):
+            for picking, state, count in self.env[model]._read_group(
+                [("picking_id", "in", self._origin.ids)],
+                ["picking_id", "state"],
+                ["__count"],
+            ):
+                counts[picking.id][state] += count
 
-            states = record.qc_inspection_ids.mapped("state")
+        for record in self:
+            state_counts = counts[record._origin.id]
+            record.qc_inspection_count = sum(state_counts.values())
 
-            if "fail" in states:
+            if not record.require_qc or not state_counts:
+                record.qc_status = "none"
+            elif "fail" in state_counts:
                 record.qc_status = "failed"
-            elif all(s == "pass" for s in states):
+            elif set(state_counts) == {"pass"}:
                 record.qc_status = "passed"
-            elif any(s == "in_progress" for s in states):
+            elif "in_progress" in state_counts:
                 record.qc_status = "in_progress"
             else:
                 record.qc_status = "pending"
 
+    def _recompute_qc_status(self):
+        """Recompute the QC status of these transfers right away."""
+        for fname in ("qc_status", "qc_inspection_count"):
+            self.env.add_to_compute(self._fields[fname], self)
+        self.flush_recordset(["qc_status", "qc_inspection_count"])
+
+    def write(self, vals):
+        if "partner_id" not in vals:
+            return super().write(vals)
+        # The inspections' supplier is a stored related field: it is
+        # recomputed without going through qc.inspection.write.
+        inspections = self.sudo().qc_inspection_ids
+        keys = inspections._get_stat_keys()
+        res = super().write(vals)
+        if inspections:
+            self.env["qc.inspection.stat.daily"].sudo()._refresh_buckets(
+                keys | inspections._get_stat_keys()
+            )
+        return res
+
     def action_view_qc_inspections(self):
         self.ensure_one()
         return {
@@ -79,38 +131,138 @@ class StockPicking(models.Model):
             },
         }
 
-    def action_create_qc_inspection(self):
-        self.ensure_one()
+    def _prepare_qc_inspection_vals(self):
+        """Inspection values for the products of these transfers that have
+        no active inspection yet, one per (transfer, product)."""
+        existing = {
+            (picking.id, product.id)
+            for picking, product in self.env["qc.inspection"]._read_group(
+                [("picking_id", "in", self.ids), ("state", "!=", "cancel")],
+                ["picking_id", "product_id"],
+            )
+        }
 
-        if not self.move_ids_without_package:
-            raise UserError("No products found in this transfer!")
+        vals_list = []
+        for picking in self:
+            for move in picking.move_ids_without_package:
+                key = (picking.id, move.product_id.id)
+                if not move.product_id or key in existing:
+                    continue
+                existing.add(key)
+                vals_list.append(
+                    {
+                        "product_id": move.product_id.id,
+                        "picking_id": picking.id,
+                        "lot_size": move.product_uom_qty,
+                        "quantity_to_inspect": move.product_uom_qty,
+                        "lot_id": move.lot_ids[0].id if move.lot_ids else False,
+                        "company_id": picking.company_id.id,
+                    }
+                )
+        return vals_list
 
-        inspections_created = []
+    def _filter_skipped_lots(self, vals_list, force_all=False):
+        """Drop the lots that skip-lot inspection lets through uninspected.
 
-        for move in self.move_ids_without_package:
-            if not move.product_id:
-                continue
+        Products skipped earlier on a transfer stay skipped, and only the
+        products it has not decided on yet (e.g. a line added later) are
+        evaluated. ``force_all`` inspects every product instead; only an
+        explicit Create QC passes it.
+        """
+        if force_all:
+            self.filtered("qc_skipped_product_ids").qc_skipped_product_ids = [
+                Command.clear()
+            ]
+            return vals_list
+        skipped_before = {
+            (picking.id, product.id)
+            for picking in self
+            for product in picking.qc_skipped_product_ids
+        }
+        vals_list = [
+            vals
+            for vals in vals_list
+            if (vals["picking_id"], vals["product_id"]) not in skipped_before
+        ]
+        to_evaluate = self.browse({vals["picking_id"] for vals in vals_list})
+        if not to_evaluate:
+            return vals_list
+        to_evaluate.filtered(
+            lambda p: not p.qc_skip_lot_evaluated
+        ).qc_skip_lot_evaluated = True
 
-            existing = self.env["qc.inspection"].search(
-                [
-                    ("picking_id", "=", self.id),
-                    ("product_id", "=", move.product_id.id),
-                    ("state", "!=", "cancel"),
-                ]
-            )
+        partners = {picking.id: picking.partner_id.id for picking in to_evaluate}
+        decisions = self.env["qc.supplier.quality"].sudo()._decide_skip_lots(
+            [
+                (
+                    partners[vals["picking_id"]],
+                    vals["product_id"],
+                    vals["company_id"] or None,
+                )
+                for vals in vals_list
+            ]
+        )
+        skipped = [vals for vals, skip in zip(vals_list, decisions) if skip]
+        if not skipped:
+            return vals_list
 
-            if existing:
-                continue
+        skipped_products = defaultdict(list)
+        for vals in skipped:
+            skipped_products[vals["picking_id"]].append(vals["product_id"])
+        for picking_id, product_ids in skipped_products.items():
+            self.browse(picking_id).qc_skipped_product_ids = [
+                Command.link(product_id) for product_id in product_ids
+            ]
+        Product = self.env["product.product"]
+        self.browse(skipped_products)._message_log_batch(
+            {
+                picking_id: "Skip-lot inspection: no QC inspection needed for "
+                + ", ".join(Product.browse(product_ids).mapped("display_name"))
+                for picking_id, product_ids in skipped_products.items()
+            }
+        )
+        skipped_ids = {id(vals) for vals in skipped}
+        return [vals for vals in vals_list if id(vals) not in skipped_ids]
 
-            inspection = self.env["qc.inspection"].create(
-                {
-                    "product_id": move.product_id.id,
-                    "picking_id": self.id,
-                    "quantity_to_inspect": move.product_uom_qty,
-                    "lot_id": move.lot_ids[0].id if move.lot_ids else False,
-                }
+    def _auto_create_qc_inspections(self):
+        pickings = self.filtered(
+            lambda p: p.picking_type_code == "incoming"
+            and p.state in ["assigned", "confirmed"]
+        )
+        if pickings:
+            self.env["qc.inspection"].sudo()._auto_create_for_pickings(
+                pickings.sudo()
             )
-            inspections_created.append(inspection.id)
+
+    @instrumented("action_create_qc_inspection")
+    def action_create_qc_inspection(self):
+        self.ensure_one()
+
+        if not self.move_ids_without_package:
+            raise UserError("No products found in this transfer!")
+
+        vals_list = self._prepare_qc_inspection_vals()
+        # Once skip-lot has decided on this transfer, clicking Create QC again
+        # inspects the products it let through.
+        to_create = self._filter_skipped_lots(
+            vals_list, force_all=self.qc_skip_lot_evaluated
+        )
+        inspections_created = (
+            self.env["qc.inspection"]._create_or_skip(to_create).ids
+        )
+
+        if vals_list and not to_create:
+            # Not an error: raising would roll the skip-lot decision back.
+            return {
+                "type": "ir.actions.client",
+                "tag": "display_notification",
+                "params": {
+                    "type": "info",
+                    "message": "Skip-lot inspection: this supplier's products "
+                    "need no QC inspection on this transfer. Click again to "
+                    "inspect them anyway.",
+                },
+            }
 
         if not inspections_created:
             raise UserError(
@@ -135,7 +287,10 @@ class StockPicking(models.Model):
                 "target": "current",
             }
 
+    @instrumented("button_validate")
     def button_validate(self):
+        # Do not trust a status still waiting in the queue.
+        self._recompute_qc_status()
         for picking in self:
             if picking.require_qc and picking.qc_status in ["pending", "in_progress"]:
                 raise UserError(
@@ -152,3 +307,14 @@ class StockPicking(models.Model):
                 )
 
         return super().button_validate()
+
+
+class StockMove(models.Model):
+    _inherit = "stock.move"
+
+    def _action_confirm(self, merge=True, merge_into=False):
+        moves = super()._action_confirm(merge=merge, merge_into=merge_into)
+        # Create inspections as soon as the receipt is confirmed; the cron
+        # only picks up whatever this hook missed.
+        moves.picking_id._auto_create_qc_inspections()
+        return moves
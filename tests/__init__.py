@@ -0,0 +1,8 @@
+from . import (
+    test_qc_aql,
+    test_qc_benchmark,
+    test_qc_checklist_progress,
+    test_qc_inspection_duplicates,
+    test_qc_query_plans,
+    test_qc_supplier_quality,
+)
@@ -0,0 +1,33 @@
+"""ISO 2859-1 plan lookups at the edges of the master tables."""
+
+from odoo.tests import tagged
+from odoo.tests.common import BaseCase
+
+from ..tools import aql
+
+
+@tagged("post_install", "-at_install")
+class TestQCAql(BaseCase):
+
+    def test_up_arrow_on_first_row(self):
+        # Letter A points up at AQL 10: there is no row above, so the plan is
+        # the first one below instead of wrapping around to letter S.
+        self.assertEqual(aql.code_letter(5, "II"), "A")
+        self.assertEqual(aql.get_plan(5, "II", "10"), ("C", 5, 1, 2))
+        self.assertEqual(aql.get_plan(2, "S1", "10"), ("C", 2, 1, 2))
+
+    def test_down_arrow_on_last_row(self):
+        self.assertEqual(aql.code_letter(1000000, "III"), "R")
+        self.assertEqual(aql.get_plan(1000000, "III", "0.010"), ("Q", 1250, 0, 1))
+        self.assertEqual(
+            aql.get_plan(1000000, "III", "0.010", "tightened"), ("S", 3150, 0, 1)
+        )
+
+    def test_plans_are_consistent(self):
+        for severity, plans in aql.PLANS.items():
+            for (letter, value), plan in plans.items():
+                plan_letter, sample_size, acceptance, rejection = plan
+                self.assertEqual(sample_size, aql.SAMPLE_SIZES[plan_letter])
+                self.assertLess(acceptance, rejection)
+                if severity != "tightened":
+                    self.assertNotEqual(plan_letter, "S", (letter, value))
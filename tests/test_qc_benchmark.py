@@ -0,0 +1,304 @@
+"""Synthetic-volume benchmarks for the QC hot paths.
+
+Not part of the regular test run. Launch them explicitly with::
+
+    odoo-bin -d <db> -i smart_inventory_qc --test-tags qc_benchmark
+
+Volumes are read from ``QC_BENCH_*`` environment variables (see
+``BENCH_DEFAULTS``) and the timings and SQL query counts are written as JSON
+to ``QC_BENCH_OUTPUT`` so that runs can be diffed.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from odoo import Command
+from odoo.tests import HttpCase, tagged
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+BENCH_DEFAULTS = {
+    "suppliers": 50,
+    "products": 500,
+    "pickings": 200,
+    "moves_per_picking": 20,
+    "history_inspections": 50000,
+    "history_years": 3,
+    "checklist_lines": 5,
+    "bulk_size": 500,
+}
+
+
+def _bench_config():
+    return {
+        key: int(os.environ.get(f"QC_BENCH_{key.upper()}", default))
+        for key, default in BENCH_DEFAULTS.items()
+    }
+
+
+@tagged("-standard", "-at_install", "post_install", "qc_benchmark")
+class TestQCBenchmark(HttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.config = _bench_config()
+        cls.results = []
+        cls.picking_type = cls.env.ref("stock.picking_type_in")
+
+        cls.suppliers = cls.env["res.partner"].create(
+            [
+                {"name": f"Bench Supplier {i}", "email": f"supplier{i}@example.com"}
+                for i in range(cls.config["suppliers"])
+            ]
+        )
+        cls.products = cls.env["product.product"].create(
+            [
+                {"name": f"Bench Product {i}", "type": "consu"}
+                for i in range(cls.config["products"])
+            ]
+        )
+        cls._generate_history()
+
+    @classmethod
+    def tearDownClass(cls):
+        output = os.environ.get("QC_BENCH_OUTPUT") or os.path.join(
+            tempfile.gettempdir(), "qc_benchmark.json"
+        )
+        with open(output, "w") as f:
+            json.dump(
+                {
+                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "config": cls.config,
+                    "results": cls.results,
+                },
+                f,
+                indent=2,
+            )
+        _logger.info("QC benchmark results written to %s", output)
+        super().tearDownClass()
+
+    @classmethod
+    def _generate_history(cls):
+        """Bulk-insert completed inspections (and their checklists) spread
+        over ``history_years``, then backfill the daily statistics."""
+        cr = cls.env.cr
+        cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_inspection (
+                    name, product_id, partner_id, inspector_id, company_id,
+                    inspection_date, state, quantity_to_inspect,
+                    quantity_accepted, quantity_rejected, pass_rate,
+                    quality_rating, create_uid, create_date, write_uid,
+                    write_date
+                )
+                SELECT 'BENCH/' || g,
+                       (%(products)s::int[])[1 + mod(g, %(n_products)s)],
+                       (%(suppliers)s::int[])[1 + mod(g * 7, %(n_suppliers)s)],
+                       %(uid)s, %(company)s,
+                       NOW() - mod(g, %(days)s) * INTERVAL '1 day',
+                       CASE WHEN mod(g, 10) = 0 THEN 'fail' ELSE 'pass' END,
+                       100,
+                       CASE WHEN mod(g, 10) = 0 THEN 40 ELSE 100 - mod(g, 5) END,
+                       CASE WHEN mod(g, 10) = 0 THEN 60 ELSE mod(g, 5) END,
+                       CASE WHEN mod(g, 10) = 0 THEN 40 ELSE 100 - mod(g, 5) END,
+                       CASE WHEN mod(g, 10) = 0 THEN 'poor' ELSE 'excellent' END,
+                       %(uid)s, NOW(), %(uid)s, NOW()
+                  FROM generate_series(1, %(count)s) g
+             RETURNING id
+                """,
+                products=cls.products.ids,
+                n_products=len(cls.products),
+                suppliers=cls.suppliers.ids,
+                n_suppliers=len(cls.suppliers),
+                uid=cls.env.uid,
+                company=cls.env.company.id,
+                days=cls.config["history_years"] * 365,
+                count=cls.config["history_inspections"],
+            )
+        )
+        inspection_ids = [row[0] for row in cr.fetchall()]
+        cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_inspection_line (
+                    inspection_id, sequence, name, result,
+                    create_uid, create_date, write_uid, write_date
+                )
+                SELECT insp.id, seq, 'Checkpoint ' || seq,
+                       CASE WHEN mod(insp.id + seq, 12) = 0 THEN 'fail' ELSE 'pass' END,
+                       %(uid)s, NOW(), %(uid)s, NOW()
+                  FROM unnest(%(ids)s::int[]) AS insp(id)
+            CROSS JOIN generate_series(1, %(lines)s) seq
+                """,
+                ids=inspection_ids,
+                lines=cls.config["checklist_lines"],
+                uid=cls.env.uid,
+            )
+        )
+        cls.env.invalidate_all()
+        cls.env["qc.inspection.stat.daily"].rebuild_statistics()
+        cr.execute(SQL("ANALYZE qc_inspection, qc_inspection_line"))
+
+    def _create_pickings(self, count, moves_per_picking):
+        type_ = self.picking_type
+        vals_list = []
+        for i in range(count):
+            products = self.products[
+                (i * moves_per_picking) % len(self.products) :
+            ][:moves_per_picking]
+            vals_list.append(
+                {
+                    "partner_id": self.suppliers[i % len(self.suppliers)].id,
+                    "picking_type_id": type_.id,
+                    "location_id": type_.default_location_src_id.id,
+                    "location_dest_id": type_.default_location_dest_id.id,
+                    "move_ids": [
+                        Command.create(
+                            {
+                                "name": product.name,
+                                "product_id": product.id,
+                                "product_uom": product.uom_id.id,
+                                "product_uom_qty": 10 + j,
+                                "location_id": type_.default_location_src_id.id,
+                                "location_dest_id": type_.default_location_dest_id.id,
+                            }
+                        )
+                        for j, product in enumerate(products)
+                    ],
+                }
+            )
+        return self.env["stock.picking"].create(vals_list)
+
+    @contextmanager
+    def _measure(self, name, rows=0):
+        self.env.flush_all()
+        queries_before = self.env.cr.sql_log_count
+        start = time.perf_counter()
+        yield
+        self.env.flush_all()
+        elapsed = time.perf_counter() - start
+        result = {
+            "name": name,
+            "seconds": round(elapsed, 4),
+            "queries": self.env.cr.sql_log_count - queries_before,
+            "rows": rows,
+        }
+        self.results.append(result)
+        _logger.info("QC benchmark %s", result)
+
+    def test_cron_auto_create_incoming_qc(self):
+        pickings = self._create_pickings(
+            self.config["pickings"], self.config["moves_per_picking"]
+        )
+        pickings.action_confirm()
+        expected = self.env["qc.inspection"].search_count(
+            [("picking_id", "in", pickings.ids)]
+        )
+        self.assertTrue(expected)
+        # Drop what the confirmation hook created, and its skip-lot decision,
+        # to leave a cron backlog.
+        self.env.flush_all()
+        self.env.cr.execute(
+            SQL(
+                """
+                WITH deleted AS (
+                    DELETE FROM qc_inspection WHERE picking_id = ANY(%(ids)s)
+                )
+                UPDATE stock_picking SET qc_skip_lot_evaluated = FALSE
+                 WHERE id = ANY(%(ids)s)
+                """,
+                ids=pickings.ids,
+            )
+        )
+        self.env.invalidate_all()
+
+        with self._measure("cron_auto_create_incoming_qc", len(pickings)):
+            created = self.env["qc.inspection"].cron_auto_create_incoming_qc()
+
+        self.assertGreaterEqual(created, expected)
+        self.assertEqual(
+            self.env["qc.inspection"].search_count(
+                [("picking_id", "in", pickings.ids)]
+            ),
+            expected,
+        )
+        self.assertFalse(
+            self.env["qc.inspection"]._get_incoming_pickings_without_qc(
+                min(pickings.ids) - 1, 1
+            )
+        )
+
+    def test_action_create_qc_inspection(self):
+        picking = self._create_pickings(1, self.config["bulk_size"])
+
+        with self._measure("action_create_qc_inspection", len(picking.move_ids)):
+            picking.action_create_qc_inspection()
+
+        self.assertEqual(picking.qc_inspection_count, len(picking.move_ids))
+
+    def test_bulk_state_transitions(self):
+        picking = self._create_pickings(1, self.config["bulk_size"])
+        picking.action_create_qc_inspection()
+        inspections = picking.qc_inspection_ids
+
+        with self._measure("action_start_inspection (bulk)", len(inspections)):
+            inspections.action_start_inspection()
+        passed, failed = inspections[: len(inspections) // 2], inspections[
+            len(inspections) // 2 :
+        ]
+        with self._measure("action_pass (bulk)", len(passed)):
+            passed.action_pass()
+        with self._measure("action_fail (bulk)", len(failed)):
+            failed.action_fail()
+        with self._measure("qc_status_queue", 1):
+            self.env["qc.status.queue"].cron_process_queue()
+
+        self.assertEqual(picking.qc_status, "failed")
+
+    def test_button_validate(self):
+        picking = self._create_pickings(1, self.config["moves_per_picking"])
+        picking.action_confirm()
+        picking.qc_inspection_ids.action_start_inspection()
+        picking.qc_inspection_ids.action_pass()
+        for move in picking.move_ids:
+            move.quantity = move.product_uom_qty
+        picking.move_ids.picked = True
+
+        with self._measure("button_validate", len(picking.move_ids)):
+            picking.button_validate()
+
+        self.assertEqual(picking.state, "done")
+
+    def test_dashboard(self):
+        self.authenticate("admin", "admin")
+
+        with self._measure("/qc/dashboard"):
+            response = self.url_open("/qc/dashboard")
+        self.assertEqual(response.status_code, 200)
+
+        with self._measure("_get_dashboard_stats"):
+            self.env["qc.inspection"]._get_dashboard_stats()
+
+    def test_analysis_pivots(self):
+        Stat = self.env["qc.inspection.stat.daily"]
+        measures = [
+            "inspection_count:sum",
+            "quantity_inspected:sum",
+            "quantity_rejected:sum",
+            "pass_rate:avg",
+        ]
+
+        with self._measure("analysis pivot (product x month)"):
+            Stat.read_group([], measures, ["product_id", "date:month"], lazy=False)
+        with self._measure("supplier pivot (supplier x product)"):
+            Stat.read_group([], measures, ["partner_id", "product_id"], lazy=False)
+        with self._measure("trend graph (week)"):
+            Stat.read_group([], ["pass_rate:avg"], ["date:week"])
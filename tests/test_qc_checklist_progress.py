@@ -0,0 +1,67 @@
+"""Stored checklist progress follows its lines."""
+
+from odoo import Command
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import SQL
+
+
+@tagged("post_install", "-at_install")
+class TestQCChecklistProgress(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product = cls.env["product.product"].create(
+            {"name": "Checklist Product", "type": "consu"}
+        )
+        cls.env["qc.checklist.template"].create(
+            {
+                "name": "Checklist Template",
+                "product_id": cls.product.id,
+                "line_ids": [
+                    Command.create({"sequence": i, "name": f"Checkpoint {i}"})
+                    for i in range(3)
+                ],
+            }
+        )
+
+    def _stored_progress(self, inspection):
+        self.env.flush_all()
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT checklist_total, checklist_done, checklist_failed,
+                       ROUND(checklist_progress::numeric, 2)
+                  FROM qc_inspection
+                 WHERE id = %s
+                """,
+                inspection.id,
+            )
+        )
+        total, done, failed, progress = self.env.cr.fetchone()
+        return total, done, failed, float(progress)
+
+    def test_progress_follows_lines(self):
+        # Lines come from the template through INSERT ... SELECT.
+        inspection = self.env["qc.inspection"]._create_or_skip(
+            [{"product_id": self.product.id, "quantity_to_inspect": 10}]
+        )
+        self.assertEqual(self._stored_progress(inspection), (3, 0, 0, 0.0))
+
+        first, second, third = inspection.checklist_ids
+        first.result = "pass"
+        self.assertEqual(self._stored_progress(inspection), (3, 1, 0, 33.33))
+
+        second.result = "fail"
+        self.assertEqual(self._stored_progress(inspection), (3, 2, 1, 66.67))
+
+        second.result = "pass"
+        self.assertEqual(self._stored_progress(inspection), (3, 2, 0, 66.67))
+
+        inspection.write(
+            {"checklist_ids": [Command.create({"name": "Extra", "result": "fail"})]}
+        )
+        self.assertEqual(self._stored_progress(inspection), (4, 3, 1, 75.0))
+
+        third.unlink()
+        self.assertEqual(self._stored_progress(inspection), (3, 3, 1, 100.0))
@@ -0,0 +1,48 @@
+"""One active inspection per transfer and product, whoever can see it."""
+
+from odoo.exceptions import ValidationError
+from odoo.tests import TransactionCase, new_test_user, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestQCInspectionDuplicates(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        groups = "smart_inventory_qc.group_qc_inspector,stock.group_stock_user"
+        cls.inspector = new_test_user(cls.env, "qc_dup_inspector", groups=groups)
+        cls.other_inspector = new_test_user(
+            cls.env, "qc_dup_other_inspector", groups=groups
+        )
+        cls.product = cls.env["product.product"].create(
+            {"name": "Duplicate Product", "type": "consu"}
+        )
+        picking_type = cls.env.ref("stock.picking_type_in")
+        cls.picking = cls.env["stock.picking"].create(
+            {
+                "picking_type_id": picking_type.id,
+                "location_id": picking_type.default_location_src_id.id,
+                "location_dest_id": picking_type.default_location_dest_id.id,
+            }
+        )
+        cls.env["qc.inspection"].create(
+            {
+                "product_id": cls.product.id,
+                "picking_id": cls.picking.id,
+                "inspector_id": cls.other_inspector.id,
+            }
+        )
+
+    def test_duplicate_hidden_by_record_rules(self):
+        Inspection = self.env["qc.inspection"].with_user(self.inspector)
+        self.assertFalse(Inspection.search([("picking_id", "=", self.picking.id)]))
+
+        with self.assertRaisesRegex(ValidationError, "already exists"):
+            Inspection.create(
+                {"product_id": self.product.id, "picking_id": self.picking.id}
+            )
+
+        inspection = Inspection.create({"product_id": self.product.id})
+        with self.assertRaisesRegex(ValidationError, "already exists"):
+            inspection.picking_id = self.picking
@@ -0,0 +1,171 @@
+"""Query-plan regression tests for the hot ``qc.inspection`` access paths.
+
+A large history is seeded with plain SQL and analyzed, then the queries the
+dashboard, search filters, creation paths, supplier analysis and daily
+statistics refresh run are EXPLAINed: none of them may fall back to a
+sequential scan of the table.
+"""
+
+import re
+from datetime import datetime, time, timedelta
+
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import SQL
+
+HISTORY_SIZE = 50000
+HISTORY_DAYS = 3 * 365
+ARCHIVE_SIZE = 20000
+
+
+@tagged("post_install", "-at_install")
+class TestQCQueryPlans(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        picking_type = cls.env.ref("stock.picking_type_in")
+        cls.suppliers = cls.env["res.partner"].create(
+            [{"name": f"Plan Supplier {i}"} for i in range(50)]
+        )
+        cls.products = cls.env["product.product"].create(
+            [{"name": f"Plan Product {i}", "type": "consu"} for i in range(50)]
+        )
+        cls.pickings = cls.env["stock.picking"].create(
+            [
+                {
+                    "partner_id": cls.suppliers[i].id,
+                    "picking_type_id": picking_type.id,
+                    "location_id": picking_type.default_location_src_id.id,
+                    "location_dest_id": picking_type.default_location_dest_id.id,
+                }
+                for i in range(20)
+            ]
+        )
+        cls.env.flush_all()
+
+        # Mostly completed history without transfer, 1% of the rows on the
+        # transfers above (one product each) and 1% still open.
+        cls.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_inspection (
+                    name, product_id, partner_id, picking_id, inspector_id,
+                    company_id, inspection_date, state, quantity_to_inspect,
+                    quantity_accepted, quantity_rejected, pass_rate,
+                    create_uid, create_date, write_uid, write_date
+                )
+                SELECT 'PLAN/' || g,
+                       CASE WHEN mod(g, 100) = 0
+                            THEN (%(products)s::int[])[1 + (g / 100 / 20)]
+                            ELSE (%(products)s::int[])[1 + mod(g, 50)]
+                       END,
+                       (%(suppliers)s::int[])[1 + mod(g * 7, 50)],
+                       CASE WHEN mod(g, 100) = 0
+                            THEN (%(pickings)s::int[])[1 + mod(g / 100, 20)]
+                       END,
+                       %(uid)s, %(company)s,
+                       NOW() - mod(g, %(days)s) * INTERVAL '1 day',
+                       CASE WHEN mod(g, 100) = 1 THEN 'draft'
+                            WHEN mod(g, 100) = 2 THEN 'in_progress'
+                            WHEN mod(g, 20) = 3 THEN 'fail'
+                            WHEN mod(g, 50) = 4 THEN 'cancel'
+                            ELSE 'pass'
+                       END,
+                       100, 100, 0, 100,
+                       %(uid)s, NOW(), %(uid)s, NOW()
+                  FROM generate_series(1, %(count)s) g
+                """,
+                products=cls.products.ids,
+                suppliers=cls.suppliers.ids,
+                pickings=cls.pickings.ids,
+                uid=cls.env.uid,
+                company=cls.env.company.id,
+                days=HISTORY_DAYS,
+                count=HISTORY_SIZE,
+            )
+        )
+        cls.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO qc_inspection_archive (
+                    original_id, name, product_id, partner_id, company_id,
+                    inspection_date, state, quantity_to_inspect,
+                    quantity_accepted, quantity_rejected, pass_rate, archived_on
+                )
+                SELECT -g, 'PLAN/A/' || g,
+                       (%(products)s::int[])[1 + mod(g, 50)],
+                       (%(suppliers)s::int[])[1 + mod(g * 7, 50)],
+                       %(company)s,
+                       NOW() - (%(days)s + mod(g, %(days)s)) * INTERVAL '1 day',
+                       CASE WHEN mod(g, 20) = 3 THEN 'fail' ELSE 'pass' END,
+                       100, 100, 0, 100, NOW()
+                  FROM generate_series(1, %(count)s) g
+                """,
+                products=cls.products.ids,
+                suppliers=cls.suppliers.ids,
+                company=cls.env.company.id,
+                days=HISTORY_DAYS,
+                count=ARCHIVE_SIZE,
+            )
+        )
+        cls.env.cr.execute(SQL("ANALYZE qc_inspection"))
+        cls.env.cr.execute(SQL("ANALYZE qc_inspection_archive"))
+        cls.env.invalidate_all()
+
+    def _assert_index_scan(self, domain, order=None, limit=None):
+        query = self.env["qc.inspection"]._search(domain, order=order, limit=limit)
+        self.env.cr.execute(SQL("EXPLAIN %s", query.select()))
+        plan = "\n".join(row[0] for row in self.env.cr.fetchall())
+        self.assertNotIn("Seq Scan on qc_inspection", plan, plan)
+        self.assertIn("Index", plan, plan)
+
+    def test_dashboard_date_range(self):
+        today = datetime.combine(datetime.now().date(), time.min)
+        self._assert_index_scan([("inspection_date", ">=", today - timedelta(days=30))])
+
+    def test_recent_failures(self):
+        self._assert_index_scan(
+            [("state", "=", "fail")], order="inspection_date desc", limit=5
+        )
+
+    def test_open_state_filters(self):
+        self._assert_index_scan([("state", "=", "draft")])
+        self._assert_index_scan([("state", "in", ["draft", "in_progress"])])
+
+    def test_picking_product_state(self):
+        self._assert_index_scan(
+            [
+                ("picking_id", "in", self.pickings[:5].ids),
+                ("product_id", "in", self.products[:5].ids),
+                ("state", "!=", "cancel"),
+            ]
+        )
+        self._assert_index_scan([("picking_id", "=", self.pickings[0].id)])
+
+    def test_supplier_analysis(self):
+        self._assert_index_scan(
+            [
+                ("partner_id", "=", self.suppliers[0].id),
+                ("inspection_date", ">=", datetime.now() - timedelta(days=365)),
+            ]
+        )
+
+    def test_stat_bucket_refresh(self):
+        Stat = self.env["qc.inspection.stat.daily"]
+        keys = {
+            (
+                datetime.now().date() - timedelta(days=i),
+                self.suppliers[i].id,
+                self.products[i].id,
+                self.env.company.id,
+            )
+            for i in range(3)
+        }
+        query = Stat._get_upsert_query(Stat._get_bucket_join(keys))
+        self.env.cr.execute(SQL("EXPLAIN %s", query))
+        plan = "\n".join(row[0] for row in self.env.cr.fetchall())
+        self.assertIsNone(
+            re.search(r"Seq Scan on qc_inspection(_archive)? ", plan), plan
+        )
+        self.assertIn("qc_inspection_product_date_index", plan, plan)
+        self.assertIn("qc_inspection_archive_product_date_index", plan, plan)
@@ -0,0 +1,138 @@
+"""Skip-lot inspection and ISO 2859-1 switching per supplier and product."""
+
+from odoo import Command
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestQCSupplierQuality(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ICP = cls.env["ir.config_parameter"].sudo()
+        ICP.set_param("smart_inventory_qc.skip_lot_min_streak", 3)
+        ICP.set_param("smart_inventory_qc.skip_lot_min_pass_rate", 90)
+        ICP.set_param("smart_inventory_qc.skip_lot_frequency", 3)
+        cls.picking_type = cls.env.ref("stock.picking_type_in")
+        cls.supplier = cls.env["res.partner"].create({"name": "Trusted Supplier"})
+        cls.product, cls.other_product = cls.env["product.product"].create(
+            [
+                {"name": "Trusted Product", "type": "consu"},
+                {"name": "New Product", "type": "consu"},
+            ]
+        )
+
+    def _move_vals(self, product):
+        type_ = self.picking_type
+        return {
+            "name": product.name,
+            "product_id": product.id,
+            "product_uom": product.uom_id.id,
+            "product_uom_qty": 10,
+            "location_id": type_.default_location_src_id.id,
+            "location_dest_id": type_.default_location_dest_id.id,
+        }
+
+    def _receive(self):
+        type_ = self.picking_type
+        picking = self.env["stock.picking"].create(
+            {
+                "partner_id": self.supplier.id,
+                "picking_type_id": type_.id,
+                "location_id": type_.default_location_src_id.id,
+                "location_dest_id": type_.default_location_dest_id.id,
+                "move_ids": [Command.create(self._move_vals(self.product))],
+            }
+        )
+        picking.action_confirm()
+        return picking
+
+    def _complete(self, picking, verdict="pass"):
+        inspections = picking.qc_inspection_ids
+        self.assertTrue(inspections)
+        inspections.action_start_inspection()
+        getattr(inspections, f"action_{verdict}")()
+
+    def _history(self):
+        return self.env["qc.supplier.quality"].search(
+            [
+                ("partner_id", "=", self.supplier.id),
+                ("product_id", "=", self.product.id),
+            ]
+        )
+
+    def _trust(self):
+        for _i in range(3):
+            self._complete(self._receive())
+        self.assertTrue(self._history().skip_lot_active)
+
+    def test_skip_lot_frequency(self):
+        self._complete(self._receive())
+        self._complete(self._receive())
+        self.assertFalse(self._history().skip_lot_active)
+        self._complete(self._receive())
+        self.assertTrue(self._history().skip_lot_active)
+
+        # One receipt in three is inspected.
+        pickings = [self._receive() for _i in range(6)]
+        inspected = [bool(picking.qc_inspection_ids) for picking in pickings]
+        self.assertEqual(inspected, [False, False, True, False, False, True])
+        self.assertEqual(pickings[0].qc_skipped_product_ids, self.product)
+        self.assertEqual(self._history().skipped_lot_count, 4)
+
+        # A failed inspection puts the pair back on full inspection.
+        self._complete(pickings[2], "fail")
+        self.assertFalse(self._history().skip_lot_active)
+        self.assertTrue(self._receive().qc_inspection_ids)
+
+    def test_skip_decision_survives_later_confirmation(self):
+        self._trust()
+        picking = self._receive()
+        self.assertFalse(picking.qc_inspection_ids)
+
+        # A line added later only gets its own decision.
+        picking.write(
+            {"move_ids": [Command.create(self._move_vals(self.other_product))]}
+        )
+        picking.move_ids.filtered(lambda m: m.state == "draft")._action_confirm()
+        self.assertEqual(picking.qc_inspection_ids.product_id, self.other_product)
+        self.assertEqual(picking.qc_skipped_product_ids, self.product)
+
+        # The reconciliation cron leaves the skipped product alone too.
+        self.env["qc.inspection"].cron_auto_create_incoming_qc()
+        self.assertEqual(picking.qc_inspection_ids.product_id, self.other_product)
+
+        # An explicit Create QC inspects it anyway.
+        picking.action_create_qc_inspection()
+        self.assertEqual(
+            picking.qc_inspection_ids.product_id, self.product | self.other_product
+        )
+        self.assertFalse(picking.qc_skipped_product_ids)
+
+    def test_switching_rules(self):
+        History = self.env["qc.supplier.quality"]
+        state = {"severity": "normal", "recent_results": "", "switching_score": 0}
+
+        def run(results, acceptance_number=1):
+            for accepted in results:
+                History._switch(state, accepted, acceptance_number)
+            return state["severity"]
+
+        # Normal to tightened: 2 of 5 consecutive lots rejected.
+        self.assertEqual(run([True, False, True]), "normal")
+        self.assertEqual(run([False]), "tightened")
+        # Tightened to normal: 5 consecutive lots accepted.
+        self.assertEqual(run([True] * 4), "tightened")
+        self.assertEqual(run([False] + [True] * 4), "tightened")
+        self.assertEqual(run([True]), "normal")
+        # Normal to reduced once the switching score reaches 30, which a
+        # rejected lot resets.
+        self.assertEqual(run([True] * 14), "normal")
+        self.assertEqual(state["switching_score"], 28)
+        self.assertEqual(run([False]), "normal")
+        self.assertEqual(state["switching_score"], 0)
+        self.assertEqual(run([True] * 10, acceptance_number=2), "reduced")
+        # Reduced back to normal on the first rejected lot.
+        self.assertEqual(run([True, True]), "reduced")
+        self.assertEqual(run([False]), "normal")
@@ -0,0 +1,154 @@
+"""Single sampling plans from ISO 2859-1 / ANSI Z1.4.
+
+The standard's master tables are expanded once at import time into plain
+dictionaries, so looking a plan up costs a bisect and two dict accesses.
+Reduced inspection follows ISO 2859-1:1999 (no gap between the acceptance
+and rejection numbers).
+"""
+
+import bisect
+
+LEVELS = ["S1", "S2", "S3", "S4", "I", "II", "III"]
+
+SEVERITIES = ["normal", "tightened", "reduced"]
+
+AQL_VALUES = [
+    "0.010",
+    "0.015",
+    "0.025",
+    "0.040",
+    "0.065",
+    "0.10",
+    "0.15",
+    "0.25",
+    "0.40",
+    "0.65",
+    "1.0",
+    "1.5",
+    "2.5",
+    "4.0",
+    "6.5",
+    "10",
+]
+
+# Letter S only exists in the tightened master table.
+LETTERS = "ABCDEFGHJKLMNPQRS"
+
+SAMPLE_SIZES = dict(
+    zip(
+        LETTERS,
+        [2, 3, 5, 8, 13, 20, 32, 50, 80, 125, 200, 315, 500, 800, 1250, 2000, 3150],
+    )
+)
+
+# Table 1: sample size code letter by lot size upper bound, one letter per
+# inspection level in LEVELS order.
+_CODE_LETTER_ROWS = [
+    (8, "AAAAAAB"),
+    (15, "AAAAABC"),
+    (25, "AABBBCD"),
+    (50, "ABBCCDE"),
+    (90, "BBCCCEF"),
+    (150, "BBCDDFG"),
+    (280, "BCDEEGH"),
+    (500, "BCDEFHJ"),
+    (1200, "CCEFGJK"),
+    (3200, "CDEGHKL"),
+    (10000, "CDFGJLM"),
+    (35000, "CDFHKMN"),
+    (150000, "DEGJLNP"),
+    (500000, "DEGJMPQ"),
+    (float("inf"), "DEHKNQR"),
+]
+_LOT_BOUNDS = [bound for bound, _letters in _CODE_LETTER_ROWS]
+
+UP, DOWN = "up", "down"
+
+# Tables II-A and II-B are constant along the diagonals letter index + AQL
+# index: (first diagonal carrying a plan, cells from there on). Diagonals
+# before the first one point down, diagonals past the last one point up.
+_DIAGONALS = {
+    "normal": (
+        14,
+        [
+            (0, 1),
+            UP,
+            DOWN,
+            (1, 2),
+            (2, 3),
+            (3, 4),
+            (5, 6),
+            (7, 8),
+            (10, 11),
+            (14, 15),
+            (21, 22),
+        ],
+    ),
+    "tightened": (
+        16,
+        [(0, 1), DOWN, (1, 2), (2, 3), (3, 4), (5, 6), (8, 9), (12, 13), (18, 19)],
+    ),
+}
+_LAST_LETTER = {"normal": LETTERS.index("R"), "tightened": LETTERS.index("S")}
+
+
+def _cell(severity, letter_index, aql_index):
+    start, cells = _DIAGONALS[severity]
+    diagonal = letter_index + aql_index - start
+    if diagonal < 0:
+        return DOWN
+    if diagonal >= len(cells):
+        return UP
+    return cells[diagonal]
+
+
+def _resolve(severity, letter_index, aql_index):
+    """Follow the table's arrows to the first plan, using that plan's
+    sample size. An arrow pointing past the first or the last row turns
+    back."""
+    cell = direction = _cell(severity, letter_index, aql_index)
+    while cell in (UP, DOWN):
+        if direction == DOWN and letter_index == _LAST_LETTER[severity]:
+            direction = UP
+        elif direction == UP and letter_index == 0:
+            direction = DOWN
+        letter_index += 1 if direction == DOWN else -1
+        cell = _cell(severity, letter_index, aql_index)
+    return (LETTERS[letter_index], SAMPLE_SIZES[LETTERS[letter_index]], *cell)
+
+
+def _build_plans():
+    plans = {severity: {} for severity in SEVERITIES}
+    for letter_index, letter in enumerate(LETTERS[: _LAST_LETTER["normal"] + 1]):
+        for aql_index, aql in enumerate(AQL_VALUES):
+            for severity in ("normal", "tightened"):
+                plans[severity][letter, aql] = _resolve(
+                    severity, letter_index, aql_index
+                )
+    # Reduced inspection uses the normal plan two code letters lower.
+    for letter_index, letter in enumerate(LETTERS[: _LAST_LETTER["normal"] + 1]):
+        for aql in AQL_VALUES:
+            plans["reduced"][letter, aql] = plans["normal"][
+                LETTERS[max(letter_index - 2, 0)], aql
+            ]
+    return plans
+
+
+PLANS = _build_plans()
+
+
+def code_letter(lot_size, level):
+    row = _CODE_LETTER_ROWS[bisect.bisect_left(_LOT_BOUNDS, lot_size)]
+    return row[1][LEVELS.index(level)]
+
+
+def get_plan(lot_size, level, aql, severity="normal"):
+    """Return ``(code_letter, sample_size, acceptance, rejection)`` for a lot.
+
+    The sample size never exceeds the lot: when the plan asks for more units
+    than the lot holds, every unit is inspected.
+    """
+    letter, sample_size, acceptance, rejection = PLANS[severity][
+        code_letter(lot_size, level), aql
+    ]
+    return letter, min(sample_size, lot_size), acceptance, rejection
@@ -0,0 +1,169 @@
+"""Process-local call counters and latency histograms for the QC hot paths.
+
+Metrics are kept per worker process and rendered in the Prometheus text
+format by the ``/qc/metrics`` route. Set ``smart_qc_metrics = False`` in the
+Odoo configuration file to disable them: the decorator then returns the
+function untouched, so there is no overhead at all.
+"""
+
+import os
+import threading
+import time
+from functools import wraps
+
+from odoo.tools import config
+
+ENABLED = str(config.get("smart_qc_metrics", True)).lower() not in (
+    "0",
+    "false",
+    "no",
+    "off",
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_lock = threading.Lock()
+_metrics = {}
+
+
+class _EntryMetrics:
+    __slots__ = ("calls", "errors", "seconds", "buckets", "queries", "rows")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.queries = 0
+        self.rows = 0
+
+
+def _get_cursor(obj):
+    env = getattr(obj, "env", None)
+    if env is None:
+        from odoo.http import request
+
+        env = request.env
+    return env.cr
+
+
+def _count_rows(obj, result):
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    if hasattr(obj, "_ids"):
+        return len(obj) or (len(result) if hasattr(result, "_ids") else 0)
+    return 0
+
+
+def record(entry, seconds, queries=0, rows=0, error=False):
+    with _lock:
+        metric = _metrics.get(entry)
+        if metric is None:
+            metric = _metrics[entry] = _EntryMetrics()
+        metric.calls += 1
+        metric.errors += error
+        metric.seconds += seconds
+        metric.queries += queries
+        metric.rows += rows
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                metric.buckets[index] += 1
+                break
+
+
+def instrumented(entry):
+    """Record calls, latency, SQL queries and processed rows of ``entry``.
+
+    Rows are the size of the recordset the method runs on, or the returned
+    count/recordset for model-level methods.
+    """
+
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cr = _get_cursor(self)
+            queries = cr.sql_log_count
+            start = time.perf_counter()
+            result = None
+            error = True
+            try:
+                result = func(self, *args, **kwargs)
+                error = False
+                return result
+            finally:
+                record(
+                    entry,
+                    time.perf_counter() - start,
+                    cr.sql_log_count - queries,
+                    _count_rows(self, result),
+                    error,
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def render_prometheus():
+    with _lock:
+        snapshot = {
+            entry: (
+                metric.calls,
+                metric.errors,
+                metric.seconds,
+                list(metric.buckets),
+                metric.queries,
+                metric.rows,
+            )
+            for entry, metric in sorted(_metrics.items())
+        }
+
+    pid = os.getpid()
+    lines = []
+
+    def header(name, kind, help_text):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    header("smart_qc_calls_total", "counter", "Calls per QC entry point.")
+    for entry, (calls, *_rest) in snapshot.items():
+        lines.append(f'smart_qc_calls_total{{entry="{entry}",pid="{pid}"}} {calls}')
+
+    header("smart_qc_errors_total", "counter", "Calls that raised an exception.")
+    for entry, (_calls, errors, *_rest) in snapshot.items():
+        lines.append(f'smart_qc_errors_total{{entry="{entry}",pid="{pid}"}} {errors}')
+
+    header("smart_qc_latency_seconds", "histogram", "Latency per QC entry point.")
+    for entry, (calls, _errors, seconds, buckets, *_rest) in snapshot.items():
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, buckets):
+            cumulative += count
+            lines.append(
+                f'smart_qc_latency_seconds_bucket{{entry="{entry}",pid="{pid}",'
+                f'le="{bound}"}} {cumulative}'
+            )
+        lines.append(
+            f'smart_qc_latency_seconds_bucket{{entry="{entry}",pid="{pid}",'
+            f'le="+Inf"}} {calls}'
+        )
+        lines.append(
+            f'smart_qc_latency_seconds_sum{{entry="{entry}",pid="{pid}"}} {seconds:.6f}'
+        )
+        lines.append(
+            f'smart_qc_latency_seconds_count{{entry="{entry}",pid="{pid}"}} {calls}'
+        )
+
+    header("smart_qc_sql_queries_total", "counter", "SQL queries issued.")
+    for entry, (*_rest, queries, _rows) in snapshot.items():
+        lines.append(
+            f'smart_qc_sql_queries_total{{entry="{entry}",pid="{pid}"}} {queries}'
+        )
+
+    header("smart_qc_rows_total", "counter", "Records processed.")
+    for entry, (*_rest, rows) in snapshot.items():
+        lines.append(f'smart_qc_rows_total{{entry="{entry}",pid="{pid}"}} {rows}')
+
+    return "\n".join(lines) + "\n"
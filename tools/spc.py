@@ -0,0 +1,66 @@
+"""Vectorized p-charts and tabular CUSUM over many series at once.
+
+All series are laid out back to back in flat arrays, sorted by series then
+date, and ``segments`` gives the series index of every point. Nothing loops
+over series or points in Python, so thousands of supplier/product series
+cost a handful of array passes.
+"""
+
+import numpy as np
+
+
+def segment_starts(*keys):
+    """Boolean mask of the points that start a new series, given the
+    columns identifying the series."""
+    starts = np.zeros(len(keys[0]), dtype=bool)
+    starts[0] = True
+    for key in keys:
+        starts[1:] |= key[1:] != key[:-1]
+    return starts
+
+
+def p_chart(inspected, rejected, segments, sigma=3.0):
+    """Return ``(center, p, spread, lcl, ucl)`` per point.
+
+    The center line is the series' overall fraction nonconforming, weighted
+    by quantity; the limits vary with each day's inspected quantity.
+    """
+    totals_inspected = np.bincount(segments, weights=inspected)
+    totals_rejected = np.bincount(segments, weights=rejected)
+    center = (totals_rejected / totals_inspected)[segments]
+    p = rejected / inspected
+    spread = np.sqrt(center * (1.0 - center) / inspected)
+    lcl = np.maximum(center - sigma * spread, 0.0)
+    ucl = np.minimum(center + sigma * spread, 1.0)
+    return center, p, spread, lcl, ucl
+
+
+def standardize(p, center, spread):
+    return np.divide(p - center, spread, out=np.zeros_like(p), where=spread > 0)
+
+
+def cusum(x, starts, segments):
+    """Tabular CUSUM ``S_i = max(0, S_{i-1} + x_i)``, restarted per series.
+
+    With ``X`` the running sum of ``x`` within the series, the recursion
+    unrolls to ``S_i = X_i - min(0, min(X_j for j <= i))``. The running
+    minimum is taken over all series in one pass by shifting every series
+    below the previous ones, so earlier series can never win the minimum.
+    """
+    running = np.cumsum(x)
+    first = np.flatnonzero(starts)
+    running -= (running[first] - x[first])[segments]
+
+    shift = 2.0 * np.abs(running).max() + 1.0
+    offset = shift * segments
+    running_min = np.minimum.accumulate(running - offset) + offset
+    return running - np.minimum(running_min, 0.0)
+
+
+def first_crossings(values, limit, starts):
+    """Mask of the points where ``values`` goes above ``limit``, ignoring
+    the following points of the same excursion."""
+    above = values > limit
+    previous = np.roll(above, 1)
+    previous[starts] = False
+    return above & ~previous